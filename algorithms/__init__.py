@@ -3,6 +3,7 @@
 Algorithms package for vertex cover visualization tool
 """
 
+import functools
 import importlib
 import os
 import time # Import the time module
@@ -16,6 +17,22 @@ AVAILABLE_ALGORITHMS = {
     "Brute Force": "brute_force"
 }
 
+# Resolve every algorithm module once, so runs are a plain dict lookup
+_ALGORITHM_MODULES = {
+    name: importlib.import_module(f"algorithms.{module_name}")
+    for name, module_name in AVAILABLE_ALGORITHMS.items()
+}
+_ALGO_RUN = {name: module.run for name, module in _ALGORITHM_MODULES.items()}
+_ALGO_RUN_FAST = {
+    name: module.run_fast
+    for name, module in _ALGORITHM_MODULES.items()
+    if hasattr(module, 'run_fast')
+}
+
+def _unknown_algorithm(algorithm_name: str) -> ValueError:
+    """Build the error raised for names that are not registered"""
+    return ValueError(f"Algorithm '{algorithm_name}' not found. Available: {list(AVAILABLE_ALGORITHMS.keys())}")
+
 def get_available_algorithms() -> Dict[str, str]:
     """
     Get list of available algorithms
@@ -27,7 +44,7 @@ def get_available_algorithms() -> Dict[str, str]:
 
 def load_algorithm(algorithm_name: str):
     """
-    Dynamically load an algorithm module
+    Get the module of a registered algorithm
     
     Args:
         algorithm_name: Name of the algorithm to load
@@ -38,22 +55,20 @@ def load_algorithm(algorithm_name: str):
     Raises:
         ValueError: If algorithm is not found
     """
-    if algorithm_name not in AVAILABLE_ALGORITHMS:
-        raise ValueError(f"Algorithm '{algorithm_name}' not found. Available: {list(AVAILABLE_ALGORITHMS.keys())}")
-    
-    module_name = AVAILABLE_ALGORITHMS[algorithm_name]
     try:
-        return importlib.import_module(f"algorithms.{module_name}")
-    except ImportError as e:
-        raise ValueError(f"Failed to load algorithm '{algorithm_name}': {e}")
+        return _ALGORITHM_MODULES[algorithm_name]
+    except KeyError:
+        raise _unknown_algorithm(algorithm_name) from None
 
-def run_algorithm(algorithm_name: str, graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
+def run_algorithm(algorithm_name: str, graph: Graph, **options) -> Generator[StepResult, None, VertexCoverResult]:
     """
     Run a specific algorithm on the given graph
     
     Args:
         algorithm_name: Name of the algorithm to run
         graph: The input graph
+        **options: Extra keyword arguments for the algorithm's run(), such
+            as yield_steps=False to skip intermediate steps
         
     Yields:
         StepResult: Information about each step
@@ -61,10 +76,13 @@ def run_algorithm(algorithm_name: str, graph: Graph) -> Generator[StepResult, No
     Returns:
         VertexCoverResult: Final result
     """
-    algorithm_module = load_algorithm(algorithm_name)
+    try:
+        algorithm_run = _ALGO_RUN[algorithm_name]
+    except KeyError:
+        raise _unknown_algorithm(algorithm_name) from None
     
     start_time = time.perf_counter()
-    algorithm_generator = algorithm_module.run(graph)
+    algorithm_generator = algorithm_run(graph, **options)
     try:
         while True:
             step_result = next(algorithm_generator)
@@ -76,16 +94,35 @@ def run_algorithm(algorithm_name: str, graph: Graph) -> Generator[StepResult, No
         final_result.time_taken = time_taken
         return final_result
 
-def get_algorithm_info(algorithm_name: str) -> Dict[str, Any]:
+def run_algorithm_fast(algorithm_name: str, graph: Graph) -> VertexCoverResult:
     """
-    Get information about a specific algorithm
+    Run a specific algorithm to completion without producing any steps
     
     Args:
-        algorithm_name: Name of the algorithm
+        algorithm_name: Name of the algorithm to run
+        graph: The input graph
         
     Returns:
-        Dictionary with algorithm information
+        VertexCoverResult: Final result
     """
+    algorithm_run_fast = _ALGO_RUN_FAST.get(algorithm_name)
+    if algorithm_run_fast is None:
+        # Algorithms without run_fast are drained through their generator
+        algorithm_generator = run_algorithm(algorithm_name, graph)
+        try:
+            while True:
+                next(algorithm_generator)
+        except StopIteration as e:
+            return e.value
+    
+    start_time = time.perf_counter()
+    final_result = algorithm_run_fast(graph)
+    final_result.time_taken = time.perf_counter() - start_time
+    return final_result
+
+@functools.lru_cache(maxsize=None)
+def _cached_algorithm_info(algorithm_name: str) -> Dict[str, Any]:
+    """Build the information of an algorithm once per name"""
     algorithm_module = load_algorithm(algorithm_name)
     if hasattr(algorithm_module, 'get_algorithm_info'):
         return algorithm_module.get_algorithm_info()
@@ -98,4 +135,17 @@ def get_algorithm_info(algorithm_name: str) -> Dict[str, Any]:
             "optimal": False
         }
 
-__all__ = ['get_available_algorithms', 'load_algorithm', 'run_algorithm', 'get_algorithm_info']
+def get_algorithm_info(algorithm_name: str) -> Dict[str, Any]:
+    """
+    Get information about a specific algorithm
+    
+    Args:
+        algorithm_name: Name of the algorithm
+        
+    Returns:
+        Dictionary with algorithm information
+    """
+    # Hand out a copy so callers cannot change the cached entry
+    return dict(_cached_algorithm_info(algorithm_name))
+
+__all__ = ['get_available_algorithms', 'load_algorithm', 'run_algorithm', 'run_algorithm_fast', 'get_algorithm_info']
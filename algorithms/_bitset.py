@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Bitset helpers shared by the vertex cover algorithms
+
+Edges are numbered 0..E-1 in canonical (u.id, v.id) order so that a set of
+edges can be held in a single Python int, with bit i standing for edge i.
+"""
+
+import sys
+from collections.abc import Set as AbstractSet
+from typing import Dict, Hashable, Iterator, List, Sequence, Tuple
+from models import Graph, Vertex, Edge
+
+if sys.version_info >= (3, 10):
+    def popcount(mask: int) -> int:
+        """Count the set bits of a mask using the native popcount"""
+        return mask.bit_count()
+else:
+    def popcount(mask: int) -> int:
+        """Count the set bits of a mask"""
+        return bin(mask).count("1")
+
+def order_vertices(graph: Graph) -> Tuple[List[Vertex], Dict[Vertex, int]]:
+    """
+    Number the vertices of a graph by id
+
+    Args:
+        graph: The input graph
+
+    Returns:
+        Tuple of (vertices sorted by id, vertex -> index mapping)
+    """
+    vertices = sorted(graph.get_vertices(), key=lambda v: v.id)
+    vertex_index = {vertex: index for index, vertex in enumerate(vertices)}
+    return vertices, vertex_index
+
+def order_graph(graph: Graph) -> Tuple[List[Vertex], Dict[Vertex, int], List[Edge]]:
+    """
+    Number the vertices by id and sort the edges into canonical order
+
+    Args:
+        graph: The input graph
+
+    Returns:
+        Tuple of (vertices sorted by id, vertex -> index mapping,
+        edges in canonical order)
+    """
+    vertices, vertex_index = order_vertices(graph)
+    edges = sorted(graph.get_edges(), key=lambda e: (e.u.id, e.v.id))
+    return vertices, vertex_index, edges
+
+def index_graph(graph: Graph) -> Tuple[List[Vertex], Dict[Vertex, int], List[Edge], Dict[Edge, int], List[int]]:
+    """
+    Number the vertices and edges of a graph for bitset algorithms
+
+    Args:
+        graph: The input graph
+
+    Returns:
+        Tuple of (vertices sorted by id, vertex -> index mapping,
+        edges in canonical order, edge -> index mapping,
+        incident edge mask of every vertex index)
+    """
+    vertices, vertex_index, edges = order_graph(graph)
+    edge_index = {edge: index for index, edge in enumerate(edges)}
+    incident = [0] * len(vertices)
+    for position, edge in enumerate(edges):
+        bit = 1 << position
+        incident[vertex_index[edge.u]] |= bit
+        incident[vertex_index[edge.v]] |= bit
+    return vertices, vertex_index, edges, edge_index, incident
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the index of every set bit, lowest first"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class MaskView(AbstractSet):
+    """
+    Read-only set of the items whose bits are set in a mask
+
+    Python ints are immutable, so a view is a free snapshot: building one
+    copies nothing, and later changes to the algorithm's mask do not affect
+    views that were already handed out.
+    """
+
+    __slots__ = ('_mask', '_items', '_index')
+
+    def __init__(self, mask: int, items: Sequence[Hashable], index: Dict[Hashable, int]):
+        self._mask = mask
+        self._items = items
+        self._index = index
+
+    def __contains__(self, item) -> bool:
+        position = self._index.get(item)
+        return position is not None and bool(self._mask >> position & 1)
+
+    def __iter__(self) -> Iterator:
+        items = self._items
+        return (items[position] for position in iter_bits(self._mask))
+
+    def __len__(self) -> int:
+        return popcount(self._mask)
+
+    def copy(self) -> 'MaskView':
+        """Views are immutable, so a copy is the view itself"""
+        return self
+
+    def __repr__(self) -> str:
+        return f"MaskView({set(self)!r})"
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compiled cover kernels for runs that do not need step-by-step visualization
+
+The kernels work on two parallel arrays of vertex indices (one entry per edge,
+in the canonical edge order of algorithms._bitset) and return a uint8 array
+flagging the vertices in the cover. They make the same choices as the
+generator versions of the algorithms, so both paths find the same cover.
+
+Numba is optional: without it the kernels run as plain Python.
+"""
+
+from typing import List, Tuple
+import numpy as np
+from models import Graph, Vertex
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+def edge_arrays(graph: Graph, vertices: List[Vertex]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode edges as two parallel arrays of endpoint indices, in canonical order
+
+    Args:
+        graph: The input graph
+        vertices: Vertices of the graph sorted by id
+
+    Returns:
+        Tuple of (u index array, v index array)
+    """
+    # The graph keeps its edges as sorted id arrays; ids map to indices by rank
+    ids = np.fromiter((v.id for v in vertices), dtype=np.int64, count=len(vertices))
+    eu, ev = graph.edges_soa()
+    return np.searchsorted(ids, eu), np.searchsorted(ids, ev)
+
+@njit(cache=True)
+def two_approx_cover_nb(eu, ev, n):
+    """Take both endpoints of every edge, in order, that is still uncovered"""
+    in_cover = np.zeros(n, dtype=np.uint8)
+    for i in range(eu.shape[0]):
+        if in_cover[eu[i]] == 0 and in_cover[ev[i]] == 0:
+            in_cover[eu[i]] = 1
+            in_cover[ev[i]] = 1
+    return in_cover
+
+@njit(cache=True)
+def greedy_cover_nb(eu, ev, n):
+    """Repeatedly take the lowest-index vertex of maximum remaining degree"""
+    m = eu.shape[0]
+    degree = np.zeros(n, dtype=np.int64)
+    for i in range(m):
+        degree[eu[i]] += 1
+        degree[ev[i]] += 1
+
+    # Incident edges of every vertex in compressed sparse row layout
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    for v in range(n):
+        offsets[v + 1] = offsets[v] + degree[v]
+    fill = offsets[:n].copy()
+    incident = np.empty(2 * m, dtype=np.int64)
+    for i in range(m):
+        incident[fill[eu[i]]] = i
+        fill[eu[i]] += 1
+        incident[fill[ev[i]]] = i
+        fill[ev[i]] += 1
+
+    alive = np.ones(m, dtype=np.uint8)
+    in_cover = np.zeros(n, dtype=np.uint8)
+    remaining = m
+    while remaining > 0:
+        selected = 0
+        for v in range(1, n):
+            if degree[v] > degree[selected]:
+                selected = v
+        in_cover[selected] = 1
+        for k in range(offsets[selected], offsets[selected + 1]):
+            i = incident[k]
+            if alive[i]:
+                alive[i] = 0
+                remaining -= 1
+                degree[eu[i]] -= 1
+                degree[ev[i]] -= 1
+    return in_cover
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Reduction rules for exact vertex cover search
+
+Each rule removes vertices whose place in some optimal cover is already
+known, so applying them never makes the cover worse:
+
+- an isolated vertex covers nothing and is left out;
+- a degree-one vertex is left out and its only neighbour is taken;
+- a degree-two vertex whose neighbours are adjacent (a triangle) is left
+  out and both neighbours are taken.
+
+Vertices are bit indices and neighbourhoods are int masks, as in _bitset.
+"""
+
+from typing import List, Tuple
+from ._bitset import iter_bits, popcount
+
+def reduce_vertices(adjacency: List[int], alive_mask: int) -> Tuple[int, int]:
+    """
+    Apply the reduction rules until none of them changes the graph
+
+    Args:
+        adjacency: Neighbourhood mask of every vertex index
+        alive_mask: Bitmask of the undecided vertices
+
+    Returns:
+        Tuple of (mask of vertices forced into the cover,
+        mask of the vertices still undecided)
+    """
+    forced = 0
+    changed = True
+    while changed:
+        changed = False
+        for index in iter_bits(alive_mask):
+            bit = 1 << index
+            if not alive_mask & bit:
+                continue  # Removed earlier in this pass
+            neighbours = adjacency[index] & alive_mask
+            degree = popcount(neighbours)
+            if degree == 0:
+                alive_mask &= ~bit
+            elif degree == 1 or (
+                degree == 2
+                and adjacency[(neighbours & -neighbours).bit_length() - 1] & neighbours
+            ):
+                forced |= neighbours
+                alive_mask &= ~(bit | neighbours)
+            else:
+                continue
+            changed = True
+    return forced, alive_mask
@@ -3,119 +3,242 @@
 Brute-Force Algorithm for Vertex Cover
 
 This algorithm provides an optimal solution for the minimum vertex cover problem
-by exhaustively checking every possible subset of vertices. It is guaranteed to
-find the smallest vertex cover, but it is extremely slow for larger graphs.
+by exhaustively searching a branch-and-bound tree over the vertices. It is
+guaranteed to find the smallest vertex cover, but it is still exponential and
+slow for larger graphs.
 """
 
-from typing import Generator, Set
-from itertools import combinations
+from collections import Counter
+from itertools import chain
+from typing import Generator, List, Optional, Set, Tuple
 from models import Graph, Vertex, Edge, StepResult, VertexCoverResult
+from ._bitset import MaskView, popcount
+from ._reductions import reduce_vertices
 
-def _is_vertex_cover(graph: Graph, vertex_subset: Set[Vertex]) -> bool:
+def _maximal_matching_size(adjacency: List[int], alive_mask: int) -> int:
     """
-    Checks if a given subset of vertices constitutes a valid vertex cover.
+    Size of a greedy maximal matching among the undecided vertices.
     
-    A subset is a vertex cover if for every edge in the graph, at least one
-    of its endpoints is included in the subset.
+    Any vertex cover must contain a distinct endpoint of every matched edge,
+    so this is an admissible lower bound on the vertices still needed.
     
     Args:
-        graph: The graph to check against.
-        vertex_subset: The subset of vertices to validate.
+        adjacency: Neighbourhood mask of every vertex index.
+        alive_mask: Bitmask of the undecided vertices.
         
     Returns:
-        True if the subset is a vertex cover, False otherwise.
+        Number of edges in the matching.
     """
-    for edge in graph.get_edges():
-        if edge.u not in vertex_subset and edge.v not in vertex_subset:
-            return False  # This edge is not covered
-    return True
+    matched = 0
+    size = 0
+    remaining = alive_mask
+    while remaining:
+        lowest = remaining & -remaining
+        remaining ^= lowest
+        if matched & lowest:
+            continue
+        candidates = adjacency[lowest.bit_length() - 1] & alive_mask & ~matched
+        if candidates:
+            matched |= lowest | (candidates & -candidates)
+            size += 1
+    return size
 
-def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
+def _search(graph: Graph, viz_stride: int,
+            yield_steps: bool) -> Generator[StepResult, None, Tuple[Set[Vertex], int]]:
     """
-    Run the brute-force algorithm for vertex cover.
-    
-    It iterates through all possible subset sizes (from 0 to N), generates
-    all combinations of vertices for each size, and checks if any of them
-    is a vertex cover. The first one found is guaranteed to be minimal.
+    Search for an optimal cover, yielding a StepResult for reported events.
     
     Args:
         graph: The input graph.
+        viz_stride: Only every viz_stride-th search event is reported.
+        yield_steps: If False, search silently without yielding anything.
         
     Yields:
-        StepResult: Information about each step of the algorithm for visualization.
+        StepResult: Information about the reported search events.
         
     Returns:
-        VertexCoverResult: The final, optimal result of the algorithm.
+        Tuple of (optimal vertex cover, number of search events).
     """
-    # Get all vertices and sort them to ensure consistent combination ordering
-    all_vertices = sorted(list(graph.get_vertices()), key=lambda v: v.id)
+    # Every step shows the same edges, so share the graph's immutable snapshot
+    edges_snapshot = graph.get_edges()
+
+    # A graph without edges needs no cover at all
+    if not edges_snapshot:
+        return set(), 0
+
+    # Order vertices by decreasing degree (then id) so that ties in the
+    # branching rule and the matching bound favour high-degree vertices
+    degree = Counter(chain.from_iterable((e.u, e.v) for e in edges_snapshot))
+    all_vertices = sorted(graph.get_vertices(), key=lambda v: (-degree[v], v.id))
     num_vertices = len(all_vertices)
-    step_count = 0
 
-    # Initial step to inform the user
-    yield StepResult(
-        vertex_cover_so_far=set(),
-        remaining_edges=graph.get_edges().copy(),
-        message="Starting Brute Force Algorithm. This may be very slow."
-    )
+    # A vertex touching every edge (the centre of a star) is optimal on its own
+    if degree[all_vertices[0]] == len(edges_snapshot):
+        return {all_vertices[0]}, 0
 
-    # Iterate through all possible subset sizes, from 0 to N
-    for k in range(num_vertices + 1):
-        step_count += 1
-        yield StepResult(
-            vertex_cover_so_far=set(),  # No cover found yet
-            remaining_edges=graph.get_edges().copy(),
-            message=f"Step {step_count}: Checking all subsets of size {k}..."
-        )
+    # Assign each vertex a compact bit index and store neighbourhoods as masks
+    vertex_index = {vertex: index for index, vertex in enumerate(all_vertices)}
+    adjacency: List[int] = [0] * num_vertices
+    for edge in edges_snapshot:
+        u, v = vertex_index[edge.u], vertex_index[edge.v]
+        adjacency[u] |= 1 << v
+        adjacency[v] |= 1 << u
 
-        # Generate all combinations of vertices of size k
-        for subset_tuple in combinations(all_vertices, k):
-            current_subset = set(subset_tuple)
-            step_count += 1
-            
-            # Yield a step to visualize which subset is currently being tested
+    def cover_view(mask: int) -> MaskView:
+        """Snapshot of the vertices selected by a cover mask"""
+        return MaskView(mask, all_vertices, vertex_index)
+
+    # Taking every vertex is always a cover, so it is the initial bound
+    best_mask = (1 << num_vertices) - 1
+    best_size = num_vertices
+    step_count = 0
+
+    def report(message: str, cover_mask: int) -> Generator[StepResult, None, None]:
+        """Count a search event and yield it if it falls on the stride"""
+        nonlocal step_count
+        step_count += 1
+        if yield_steps and (step_count - 1) % viz_stride == 0:
             yield StepResult(
                 vertex_cover_so_far=set(),  # Not a valid cover yet, just for viz
-                remaining_edges=graph.get_edges().copy(),
-                message=f"Step {step_count}: Testing subset: {[v.id for v in current_subset]}",
-                added_vertices=current_subset  # Use this field to highlight the set
+                remaining_edges=edges_snapshot,
+                message=f"Step {step_count}: {message}",
+                added_vertices=cover_view(cover_mask)  # Highlight the partial cover
             )
 
-            # Check if this subset is a valid vertex cover
-            if _is_vertex_cover(graph, current_subset):
-                # Since we are iterating by size, the first one found is the smallest
-                final_message = f"Found optimal vertex cover of size {len(current_subset)}."
+    def branch(alive_mask: int, cover_mask: int) -> Generator[StepResult, None, None]:
+        """Explore the subtree where alive_mask vertices are still undecided"""
+        nonlocal best_mask, best_size, step_count
+        # Settle the vertices whose choice the reduction rules already decide
+        forced, alive_mask = reduce_vertices(adjacency, alive_mask)
+        cover_mask |= forced
+        cover_size = popcount(cover_mask)
+        if cover_size >= best_size:
+            return
+
+        # Pick the undecided vertex with the most undecided neighbours
+        selected, max_degree = -1, 0
+        remaining = alive_mask
+        while remaining:
+            lowest = remaining & -remaining
+            index = lowest.bit_length() - 1
+            remaining ^= lowest
+            degree = popcount(adjacency[index] & alive_mask)
+            if degree > max_degree:
+                selected, max_degree = index, degree
+
+        if max_degree == 0:
+            # No edges are left, so the partial cover is a better cover
+            best_mask, best_size = cover_mask, cover_size
+            step_count += 1
+            if yield_steps:
                 yield StepResult(
-                    vertex_cover_so_far=current_subset,
-                    remaining_edges=set(),  # All edges are covered
-                    message=final_message,
-                    added_vertices=current_subset
+                    vertex_cover_so_far=cover_view(cover_mask),
+                    remaining_edges=edges_snapshot,
+                    message=f"Step {step_count}: Found a vertex cover of size {cover_size}"
                 )
-                
-                # Return the final result, terminating the generator
-                return VertexCoverResult(
-                    vertex_cover=current_subset,
-                    total_steps=step_count,
-                    algorithm_name="Brute Force",
-                    is_optimal=True,
-                    approximation_ratio=1.0
-                )
-    
-    # This part should only be reached if the graph has no edges.
-    # The set of all vertices is always a cover for graphs with edges.
-    yield StepResult(
-        vertex_cover_so_far=set(),
-        remaining_edges=set(),
-        message="Algorithm completed. No edges to cover."
-    )
+            return
+
+        # Every edge of a matching needs its own cover vertex
+        lower_bound = cover_size + _maximal_matching_size(adjacency, alive_mask)
+        if lower_bound >= best_size:
+            yield from report(
+                f"Pruned: a cover of size at least {lower_bound} cannot beat {best_size}",
+                cover_mask
+            )
+            return
+
+        vertex_id = all_vertices[selected].id
+        yield from report(
+            f"Branching on vertex {vertex_id} with degree {max_degree}",
+            cover_mask
+        )
+
+        # Branch 1: the selected vertex goes into the cover
+        selected_bit = 1 << selected
+        yield from branch(alive_mask & ~selected_bit, cover_mask | selected_bit)
+
+        # Branch 2: the selected vertex stays out, so all its neighbours go in
+        neighbours = adjacency[selected] & alive_mask
+        yield from branch(alive_mask & ~(selected_bit | neighbours), cover_mask | neighbours)
+
+    # Initial step to inform the user
+    if yield_steps:
+        yield StepResult(
+            vertex_cover_so_far=set(),
+            remaining_edges=edges_snapshot,
+            message="Starting Brute Force Algorithm (branch and bound). This may be slow."
+        )
+
+    yield from branch((1 << num_vertices) - 1, 0)
+    return set(cover_view(best_mask)), step_count
+
+def _result(vertex_cover: Set[Vertex], step_count: int) -> VertexCoverResult:
+    """Wrap an optimal cover in the algorithm's result."""
     return VertexCoverResult(
-        vertex_cover=set(),
+        vertex_cover=vertex_cover,
         total_steps=step_count,
         algorithm_name="Brute Force",
         is_optimal=True,
         approximation_ratio=1.0
     )
 
+def run(graph: Graph, viz_stride: Optional[int] = None,
+        yield_steps: bool = True) -> Generator[StepResult, None, VertexCoverResult]:
+    """
+    Run the branch-and-bound search for an optimal vertex cover.
+    
+    The search walks a binary tree depth-first. At every node it first
+    applies the reduction rules of _reductions, then picks an undecided
+    vertex v of maximum degree in the remaining graph and branches on
+    either putting v into the cover, or leaving v out and therefore
+    putting all of its remaining neighbours into the cover. Any branch whose
+    partial cover can no longer beat the best cover found so far is pruned.
+    
+    Args:
+        graph: The input graph.
+        viz_stride: Only every viz_stride-th search event is reported as a
+            step. Defaults to reporting every branch and prune.
+        yield_steps: If False, run the search silently and yield only the
+            final step.
+        
+    Yields:
+        StepResult: Information about each step of the algorithm for visualization.
+        
+    Returns:
+        VertexCoverResult: The final, optimal result of the algorithm.
+    """
+    if viz_stride is None:
+        viz_stride = 1
+
+    vertex_cover, step_count = yield from _search(graph, viz_stride, yield_steps)
+
+    yield StepResult(
+        vertex_cover_so_far=vertex_cover,
+        remaining_edges=set(),  # All edges are covered
+        message=f"Found optimal vertex cover of size {len(vertex_cover)}.",
+        added_vertices=vertex_cover
+    )
+
+    return _result(vertex_cover, step_count)
+
+def run_fast(graph: Graph) -> VertexCoverResult:
+    """
+    Run the search silently and return the result without any StepResult.
+    
+    Args:
+        graph: The input graph.
+        
+    Returns:
+        VertexCoverResult: The final, optimal result of the algorithm.
+    """
+    search = _search(graph, 1, yield_steps=False)
+    try:
+        while True:
+            next(search)
+    except StopIteration as stop:
+        vertex_cover, step_count = stop.value
+    return _result(vertex_cover, step_count)
+
 def get_algorithm_info() -> dict:
     """
     Get information and metadata about this algorithm.
@@ -125,8 +248,8 @@ def get_algorithm_info() -> dict:
     """
     return {
         "name": "Brute Force",
-        "description": "An exhaustive search algorithm that checks every possible vertex subset to find the optimal vertex cover. Warning: Very slow for graphs with more than ~15 vertices.",
-        "time_complexity": "O(2^V * E)",
+        "description": "An exact branch-and-bound search that branches on including a maximum-degree vertex or all of its neighbours, pruning branches that cannot beat the best cover found. Warning: Still exponential, slow for large dense graphs.",
+        "time_complexity": "O(2^V * V)",
         "approximation_ratio": 1.0,
         "optimal": True
     }
\ No newline at end of file
@@ -6,12 +6,16 @@ This algorithm uses a greedy approach by repeatedly selecting the vertex
 with the highest degree (most incident edges) and adding it to the vertex cover.
 """
 
-from typing import Generator, Set
+import heapq
+from typing import Generator, Set, Tuple
+import numpy as np
 from models import Graph, Vertex, Edge, StepResult, VertexCoverResult
+from ._bitset import MaskView, order_vertices, index_graph, popcount
+from ._kernels import edge_arrays, greedy_cover_nb
 
-def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
+def _cover_steps(graph: Graph) -> Generator[StepResult, None, Tuple[Set[Vertex], int]]:
     """
-    Run the greedy algorithm for vertex cover
+    Build the cover step by step, yielding a StepResult for every step
     
     Args:
         graph: The input graph
@@ -20,74 +24,97 @@ def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
         StepResult: Information about each step of the algorithm
         
     Returns:
-        VertexCoverResult: Final result of the algorithm
+        Tuple of (vertex cover, number of steps taken)
     """
     # Initialize
-    vertex_cover = set()
-    remaining_edges = graph.get_edges().copy()
+    vertices, vertex_index, edges, edge_index, incident = index_graph(graph)
+    cover = 0  # Bit i set once vertex i is in the cover
+    remaining = (1 << len(edges)) - 1  # Bit i set while edge i is uncovered
     step_count = 0
     
+    # Steps share the index lists; the int masks make every view a snapshot
+    def cover_view(mask: int) -> MaskView:
+        return MaskView(mask, vertices, vertex_index)
+    
+    def edge_view(mask: int) -> MaskView:
+        return MaskView(mask, edges, edge_index)
+    
+    # Max-heap of (-degree, index); entries go stale as degrees drop
+    heap = [(-popcount(mask), index) for index, mask in enumerate(incident) if mask]
+    heapq.heapify(heap)
+    
     # Initial step
     yield StepResult(
-        vertex_cover_so_far=vertex_cover.copy(),
-        remaining_edges=remaining_edges.copy(),
+        vertex_cover_so_far=cover_view(cover),
+        remaining_edges=edge_view(remaining),
         message="Starting Greedy Algorithm. Initialize empty vertex cover."
     )
     
     # Main algorithm loop
-    while remaining_edges:
+    while remaining:
         step_count += 1
         
-        # Find vertex with highest degree among remaining edges
-        vertex_degrees = {}
-        for edge in remaining_edges:
-            vertex_degrees[edge.u] = vertex_degrees.get(edge.u, 0) + 1
-            vertex_degrees[edge.v] = vertex_degrees.get(edge.v, 0) + 1
+        # Degrees only drop, so a popped entry whose degree is still current
+        # is the maximum; stale entries are re-pushed with their degree
+        while True:
+            negative_degree, selected_index = heapq.heappop(heap)
+            max_degree = popcount(incident[selected_index] & remaining)
+            if max_degree == -negative_degree:
+                break
+            if max_degree > 0:
+                heapq.heappush(heap, (-max_degree, selected_index))
         
-        if not vertex_degrees:
-            break
-            
         # Select vertex with maximum degree
-        selected_vertex = max(vertex_degrees.keys(), key=lambda v: vertex_degrees[v])
-        max_degree = vertex_degrees[selected_vertex]
+        selected_vertex = vertices[selected_index]
         
         # Show vertex selection
         yield StepResult(
-            vertex_cover_so_far=vertex_cover.copy(),
-            remaining_edges=remaining_edges.copy(),
+            vertex_cover_so_far=cover_view(cover),
+            remaining_edges=edge_view(remaining),
             message=f"Step {step_count}: Selected vertex {selected_vertex.id} with degree {max_degree}",
             added_vertices={selected_vertex}
         )
         
         # Add vertex to the vertex cover
-        vertex_cover.add(selected_vertex)
-        
-        # Find all edges incident to the selected vertex
-        edges_to_remove = set()
-        for edge in remaining_edges:
-            if edge.contains_vertex(selected_vertex):
-                edges_to_remove.add(edge)
+        cover |= 1 << selected_index
         
-        # Remove all incident edges
-        remaining_edges -= edges_to_remove
+        # Remove all remaining incident edges
+        removed = incident[selected_index] & remaining
+        remaining &= ~removed
         
         # Show the result of this step
         yield StepResult(
-            vertex_cover_so_far=vertex_cover.copy(),
-            remaining_edges=remaining_edges.copy(),
-            message=f"Added vertex {selected_vertex.id} to cover. Removed {len(edges_to_remove)} incident edges.",
+            vertex_cover_so_far=cover_view(cover),
+            remaining_edges=edge_view(remaining),
+            message=f"Added vertex {selected_vertex.id} to cover. Removed {popcount(removed)} incident edges.",
             added_vertices={selected_vertex},
-            removed_edges=edges_to_remove
+            removed_edges=edge_view(removed)
         )
     
-    # Final step
-    yield StepResult(
-        vertex_cover_so_far=vertex_cover.copy(),
-        remaining_edges=remaining_edges.copy(),
-        message=f"Algorithm completed! Found vertex cover of size {len(vertex_cover)}."
-    )
+    vertex_cover = set(cover_view(cover))
+    return vertex_cover, step_count
+
+def _compute_cover(graph: Graph) -> Set[Vertex]:
+    """
+    Compute the same cover as _cover_steps in a single compiled pass
     
-    # Return final result
+    Args:
+        graph: The input graph
+        
+    Returns:
+        Set[Vertex]: The vertex cover
+    """
+    vertices, _ = order_vertices(graph)
+    eu, ev = edge_arrays(graph, vertices)
+    in_cover = greedy_cover_nb(eu, ev, len(vertices))
+    return {vertices[index] for index in np.flatnonzero(in_cover)}
+
+def _fast_step_count(vertex_cover: Set[Vertex]) -> int:
+    """Number of steps _cover_steps would have taken for this cover"""
+    return len(vertex_cover)  # One step per selected vertex
+
+def _result(vertex_cover: Set[Vertex], step_count: int) -> VertexCoverResult:
+    """Wrap a finished cover in the algorithm's result"""
     return VertexCoverResult(
         vertex_cover=vertex_cover,
         total_steps=step_count,
@@ -96,6 +123,50 @@ def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
         approximation_ratio=None  # Greedy doesn't have a guaranteed approximation ratio
     )
 
+def run(graph: Graph, yield_steps: bool = True) -> Generator[StepResult, None, VertexCoverResult]:
+    """
+    Run the greedy algorithm for vertex cover
+    
+    Args:
+        graph: The input graph
+        yield_steps: If False, skip the intermediate steps and compute the
+            cover with a compiled kernel, yielding only the final step
+        
+    Yields:
+        StepResult: Information about each step of the algorithm
+        
+    Returns:
+        VertexCoverResult: Final result of the algorithm
+    """
+    if yield_steps:
+        vertex_cover, step_count = yield from _cover_steps(graph)
+    else:
+        vertex_cover = _compute_cover(graph)
+        step_count = _fast_step_count(vertex_cover)
+    
+    # Final step
+    yield StepResult(
+        vertex_cover_so_far=vertex_cover.copy(),
+        remaining_edges=set(),
+        message=f"Algorithm completed! Found vertex cover of size {len(vertex_cover)}."
+    )
+    
+    # Return final result
+    return _result(vertex_cover, step_count)
+
+def run_fast(graph: Graph) -> VertexCoverResult:
+    """
+    Compute the final result directly, without creating any StepResult
+    
+    Args:
+        graph: The input graph
+        
+    Returns:
+        VertexCoverResult: Final result of the algorithm
+    """
+    vertex_cover = _compute_cover(graph)
+    return _result(vertex_cover, _fast_step_count(vertex_cover))
+
 def get_algorithm_info() -> dict:
     """
     Get information about this algorithm
@@ -106,7 +177,7 @@ def get_algorithm_info() -> dict:
     return {
         "name": "Greedy",
         "description": "A greedy algorithm that repeatedly selects the vertex with the highest degree.",
-        "time_complexity": "O(V * E)",
+        "time_complexity": "O((V + E) log V)",
         "approximation_ratio": None,
         "optimal": False
     }
\ No newline at end of file
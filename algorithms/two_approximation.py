@@ -7,12 +7,15 @@ It works by repeatedly selecting an arbitrary edge and adding both its endpoints
 to the vertex cover, then removing all edges incident to these vertices.
 """
 
-from typing import Generator, Set
+from typing import Generator, Set, Tuple
+import numpy as np
 from models import Graph, Vertex, Edge, StepResult, VertexCoverResult
+from ._bitset import MaskView, order_vertices, index_graph, popcount
+from ._kernels import edge_arrays, two_approx_cover_nb
 
-def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
+def _cover_steps(graph: Graph) -> Generator[StepResult, None, Tuple[Set[Vertex], int]]:
     """
-    Run the 2-approximation algorithm for vertex cover
+    Build the cover step by step, yielding a StepResult for every step
     
     Args:
         graph: The input graph
@@ -21,68 +24,95 @@ def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
         StepResult: Information about each step of the algorithm
         
     Returns:
-        VertexCoverResult: Final result of the algorithm
+        Tuple of (vertex cover, number of steps taken)
     """
     # Initialize
-    vertex_cover = set()
-    remaining_edges = graph.get_edges().copy()
+    vertices, vertex_index, edges, edge_index, incident = index_graph(graph)
+    cover = 0  # Bit i set once vertex i is in the cover
+    remaining = (1 << len(edges)) - 1  # Bit i set while edge i is uncovered
+    covered = bytearray(len(vertices))  # Flags the vertices already in the cover
+    cursor = 0  # Every edge before the cursor is covered
     step_count = 0
     
+    # Steps share the index lists; the int masks make every view a snapshot
+    def cover_view(mask: int) -> MaskView:
+        return MaskView(mask, vertices, vertex_index)
+    
+    def edge_view(mask: int) -> MaskView:
+        return MaskView(mask, edges, edge_index)
+    
     # Initial step
     yield StepResult(
-        vertex_cover_so_far=vertex_cover.copy(),
-        remaining_edges=remaining_edges.copy(),
+        vertex_cover_so_far=cover_view(cover),
+        remaining_edges=edge_view(remaining),
         message="Starting 2-Approximation Algorithm. Initialize empty vertex cover."
     )
     
     # Main algorithm loop
-    while remaining_edges:
+    while remaining:
         step_count += 1
         
-        # Pick an arbitrary edge
-        selected_edge = next(iter(remaining_edges))
-        u, v = selected_edge.u, selected_edge.v
+        # Pick the lowest-numbered remaining edge; edges are only ever
+        # removed, so skip past the ones that already have a covered endpoint
+        while True:
+            selected_edge = edges[cursor]
+            cursor += 1
+            u, v = selected_edge.u, selected_edge.v
+            u_index, v_index = vertex_index[u], vertex_index[v]
+            if not (covered[u_index] or covered[v_index]):
+                break
         
         # Show edge selection
         yield StepResult(
-            vertex_cover_so_far=vertex_cover.copy(),
-            remaining_edges=remaining_edges.copy(),
+            vertex_cover_so_far=cover_view(cover),
+            remaining_edges=edge_view(remaining),
             message=f"Step {step_count}: Selected edge ({u.id}, {v.id})",
             selected_edge=selected_edge
         )
         
         # Add both vertices to the vertex cover
-        vertex_cover.add(u)
-        vertex_cover.add(v)
+        cover |= (1 << u_index) | (1 << v_index)
+        covered[u_index] = covered[v_index] = 1
         added_vertices = {u, v}
         
-        # Find all edges incident to u or v
-        edges_to_remove = set()
-        for edge in remaining_edges:
-            if edge.contains_vertex(u) or edge.contains_vertex(v):
-                edges_to_remove.add(edge)
-        
-        # Remove all incident edges
-        remaining_edges -= edges_to_remove
+        # Remove all remaining edges incident to u or v
+        removed = (incident[u_index] | incident[v_index]) & remaining
+        remaining &= ~removed
         
         # Show the result of this step
         yield StepResult(
-            vertex_cover_so_far=vertex_cover.copy(),
-            remaining_edges=remaining_edges.copy(),
-            message=f"Added vertices {u.id} and {v.id} to cover. Removed {len(edges_to_remove)} incident edges.",
+            vertex_cover_so_far=cover_view(cover),
+            remaining_edges=edge_view(remaining),
+            message=f"Added vertices {u.id} and {v.id} to cover. Removed {popcount(removed)} incident edges.",
             selected_edge=selected_edge,
             added_vertices=added_vertices,
-            removed_edges=edges_to_remove
+            removed_edges=edge_view(removed)
         )
     
-    # Final step
-    yield StepResult(
-        vertex_cover_so_far=vertex_cover.copy(),
-        remaining_edges=remaining_edges.copy(),
-        message=f"Algorithm completed! Found vertex cover of size {len(vertex_cover)}."
-    )
+    vertex_cover = set(cover_view(cover))
+    return vertex_cover, step_count
+
+def _compute_cover(graph: Graph) -> Set[Vertex]:
+    """
+    Compute the same cover as _cover_steps in a single compiled pass
     
-    # Return final result
+    Args:
+        graph: The input graph
+        
+    Returns:
+        Set[Vertex]: The vertex cover
+    """
+    vertices, _ = order_vertices(graph)
+    eu, ev = edge_arrays(graph, vertices)
+    in_cover = two_approx_cover_nb(eu, ev, len(vertices))
+    return {vertices[index] for index in np.flatnonzero(in_cover)}
+
+def _fast_step_count(vertex_cover: Set[Vertex]) -> int:
+    """Number of steps _cover_steps would have taken for this cover"""
+    return len(vertex_cover) // 2  # One step per selected edge
+
+def _result(vertex_cover: Set[Vertex], step_count: int) -> VertexCoverResult:
+    """Wrap a finished cover in the algorithm's result"""
     return VertexCoverResult(
         vertex_cover=vertex_cover,
         total_steps=step_count,
@@ -91,6 +121,50 @@ def run(graph: Graph) -> Generator[StepResult, None, VertexCoverResult]:
         approximation_ratio=2.0
     )
 
+def run(graph: Graph, yield_steps: bool = True) -> Generator[StepResult, None, VertexCoverResult]:
+    """
+    Run the 2-approximation algorithm for vertex cover
+    
+    Args:
+        graph: The input graph
+        yield_steps: If False, skip the intermediate steps and compute the
+            cover with a compiled kernel, yielding only the final step
+        
+    Yields:
+        StepResult: Information about each step of the algorithm
+        
+    Returns:
+        VertexCoverResult: Final result of the algorithm
+    """
+    if yield_steps:
+        vertex_cover, step_count = yield from _cover_steps(graph)
+    else:
+        vertex_cover = _compute_cover(graph)
+        step_count = _fast_step_count(vertex_cover)
+    
+    # Final step
+    yield StepResult(
+        vertex_cover_so_far=vertex_cover.copy(),
+        remaining_edges=set(),
+        message=f"Algorithm completed! Found vertex cover of size {len(vertex_cover)}."
+    )
+    
+    # Return final result
+    return _result(vertex_cover, step_count)
+
+def run_fast(graph: Graph) -> VertexCoverResult:
+    """
+    Compute the final result directly, without creating any StepResult
+    
+    Args:
+        graph: The input graph
+        
+    Returns:
+        VertexCoverResult: Final result of the algorithm
+    """
+    vertex_cover = _compute_cover(graph)
+    return _result(vertex_cover, _fast_step_count(vertex_cover))
+
 def get_algorithm_info() -> dict:
     """
     Get information about this algorithm
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the vertex cover visualization tests
+"""
+
+import sys
+
+import pytest
+
+def pytest_configure(config):
+    """Register the markers used by the tests"""
+    config.addinivalue_line(
+        "markers", "gui: builds Qt widgets (deselect with -m \"not gui\")"
+    )
+
+@pytest.fixture(scope="session")
+def qapp():
+    """
+    The QApplication shared by every GUI test of the session
+    
+    The application is not quit at teardown, so repeated pytest.main()
+    runs in one process keep reusing the same instance.
+    """
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
@@ -9,7 +9,7 @@ This script demonstrates how to:
 """
 
 from models import Graph
-from algorithms import get_available_algorithms, run_algorithm, get_algorithm_info
+from algorithms import get_available_algorithms, run_algorithm, run_algorithm_fast, get_algorithm_info
 
 def create_sample_graph() -> Graph:
     """Create a sample graph for testing"""
@@ -69,7 +69,14 @@ def run_algorithm_demo(graph: Graph, algorithm_name: str):
     algorithm_gen = run_algorithm(algorithm_name, graph)
     
     step_count = 0
-    for step_result in algorithm_gen:
+    final_result = None
+    while True:
+        try:
+            step_result = next(algorithm_gen)
+        except StopIteration as stop:
+            # The generator returns the final result
+            final_result = stop.value
+            break
         step_count += 1
         print(f"Step {step_count}: {step_result.message}")
         
@@ -91,16 +98,11 @@ def run_algorithm_demo(graph: Graph, algorithm_name: str):
         print(f"  Remaining edges: {len(step_result.remaining_edges)}")
         print()
     
-    # The last iteration returns the final result
-    try:
-        final_result = algorithm_gen.gi_frame.f_locals.get('result')
-        if hasattr(final_result, 'vertex_cover'):
-            print(f"Final Result:")
-            print(f"  Vertex Cover: {[v.id for v in final_result.vertex_cover]}")
-            print(f"  Cover Size: {len(final_result.vertex_cover)}")
-            print(f"  Total Steps: {final_result.total_steps}")
-    except:
-        pass
+    if final_result is not None:
+        print(f"Final Result:")
+        print(f"  Vertex Cover: {[v.id for v in final_result.vertex_cover]}")
+        print(f"  Cover Size: {len(final_result.vertex_cover)}")
+        print(f"  Total Steps: {final_result.total_steps}")
 
 def compare_algorithms(graph: Graph):
     """Compare different algorithms on the same graph"""
@@ -114,29 +116,14 @@ def compare_algorithms(graph: Graph):
     for algorithm_name in algorithms.keys():
         print(f"\nRunning {algorithm_name}...")
         
-        # Run algorithm and collect final result
-        algorithm_gen = run_algorithm(algorithm_name, graph)
-        steps = list(algorithm_gen)
-        
-        # Extract final result
-        try:
-            # The generator should return the final result
-            final_result = algorithm_gen.gi_frame.f_locals.get('result')
-            if final_result:
-                results[algorithm_name] = {
-                    'cover_size': len(final_result.vertex_cover),
-                    'steps': final_result.total_steps,
-                    'vertices': [v.id for v in final_result.vertex_cover]
-                }
-        except:
-            # Fallback: use the last step result
-            if steps:
-                last_step = steps[-1]
-                results[algorithm_name] = {
-                    'cover_size': len(last_step.vertex_cover_so_far),
-                    'steps': len(steps),
-                    'vertices': [v.id for v in last_step.vertex_cover_so_far]
-                }
+        # No steps are needed for the comparison, so skip them entirely
+        final_result = run_algorithm_fast(algorithm_name, graph)
+
+        results[algorithm_name] = {
+            'cover_size': len(final_result.vertex_cover),
+            'steps': final_result.total_steps,
+            'vertices': [v.id for v in final_result.vertex_cover]
+        }
     
     # Display comparison
     print(f"\n{'Algorithm':<20} {'Cover Size':<12} {'Steps':<8} {'Vertices'}")
@@ -158,7 +145,7 @@ def main():
     # Create and analyze sample graphs
     print("\n1. Triangle + Extension Graph")
     graph1 = create_sample_graph()
-    print(f"Created graph with {len(graph1.get_vertices())} vertices and {len(graph1.get_edges())} edges")
+    print(f"Created graph with {graph1.vertex_count()} vertices and {graph1.edge_count()} edges")
     
     # Run each algorithm on the sample graph
     for algorithm_name in algorithms.keys():
@@ -169,7 +156,7 @@ def main():
     
     print("\n2. Star Graph")
     graph2 = create_star_graph(num_arms=6)
-    print(f"Created star graph with {len(graph2.get_vertices())} vertices and {len(graph2.get_edges())} edges")
+    print(f"Created star graph with {graph2.vertex_count()} vertices and {graph2.edge_count()} edges")
     
     # Compare algorithms on star graph
     compare_algorithms(graph2)
@@ -5,12 +5,102 @@ Algorithm control panel for vertex cover visualization
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, 
-    QLabel, QTextEdit, QGroupBox, QSlider, QSpinBox, QCheckBox
+    QLabel, QTextEdit, QGroupBox, QSlider, QSpinBox, QCheckBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from typing import Generator, Optional
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QCoreApplication, QElapsedTimer, QObject, QSemaphore, QThread
+from typing import Dict, Generator, Optional
 from models import Graph, StepResult, VertexCoverResult
-from algorithms import get_available_algorithms, run_algorithm, get_algorithm_info
+from algorithms import get_available_algorithms, run_algorithm, run_algorithm_fast, get_algorithm_info
+
+class AlgorithmWorker(QObject):
+    """Advances an algorithm generator on a worker thread, one paced step at a time"""
+    
+    # Signals
+    step_ready = pyqtSignal(StepResult)
+    finished = pyqtSignal(VertexCoverResult)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, generator: Generator[StepResult, None, VertexCoverResult], interval_ms: int):
+        super().__init__()
+        self._generator = generator
+        self._interval_ms = interval_ms
+        self._paused = False
+        self._stopped = False
+        self._step_requested = False
+        
+        # One permit per step the panel has finished displaying, so the
+        # worker never runs ahead of the display
+        self._consumed = QSemaphore(1)
+        # Released to cut a wait short: Next Step, resume or stop
+        self._wake = QSemaphore(0)
+    
+    @pyqtSlot()
+    def run(self):
+        """Produce steps until the generator finishes or the worker is stopped"""
+        # Steps are due one interval after the previous one was sent, however
+        # long they took to compute
+        clock = QElapsedTimer()
+        clock.start()
+        try:
+            while True:
+                self._consumed.acquire()
+                if self._stopped:
+                    return
+                
+                try:
+                    step = next(self._generator)
+                except StopIteration as e:
+                    step, result = None, e.value
+                
+                # Wait out the rest of the interval, then for as long as the
+                # run is paused, unless Next Step asks for the step now
+                while self._wake.tryAcquire():
+                    pass  # Drop wake-ups left over from earlier waits
+                while not (self._stopped or self._step_requested):
+                    if self._paused:
+                        self._wake.acquire()
+                        if not self._paused:
+                            clock.restart()  # Resumed: the step is due an interval later
+                    else:
+                        remaining = max(0, self._interval_ms - clock.elapsed())
+                        if not self._wake.tryAcquire(1, remaining) and not self._paused:
+                            break
+                self._step_requested = False
+                if self._stopped:
+                    return
+                
+                if step is None:
+                    self.finished.emit(result)
+                    return
+                self.step_ready.emit(step)
+                clock.restart()
+        except Exception as e:
+            self.failed.emit(str(e))
+    
+    def step_displayed(self):
+        """Let the worker produce the next step"""
+        self._consumed.release()
+    
+    def request_step(self):
+        """Produce the next step without waiting for the interval"""
+        self._step_requested = True
+        self._wake.release()
+    
+    def pause(self):
+        """Hold steps back until resume() or request_step()"""
+        self._paused = True
+    
+    def resume(self):
+        """Go back to producing a step every interval"""
+        self._paused = False
+        self._wake.release()
+    
+    def stop(self):
+        """Make run() return at its next wait"""
+        self._stopped = True
+        self._consumed.release()
+        self._wake.release()
 
 class AlgorithmPanel(QWidget):
     """Control panel for algorithm selection and execution"""
@@ -18,6 +108,8 @@ class AlgorithmPanel(QWidget):
     # Signals
     algorithm_step = pyqtSignal(StepResult)
     algorithm_finished = pyqtSignal(VertexCoverResult)
+    reset_requested = pyqtSignal()  # Shown results should be cleared
+    run_requested = pyqtSignal()  # A run is starting; hand over pending graph edits now
 
     def _on_skip_visualization_changed(self, state):
         self.skip_visualization = (state == Qt.CheckState.Checked.value)
@@ -34,15 +126,15 @@ class AlgorithmPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.graph = None
-        self.algorithm_generator = None
         self.is_running = False
         self.current_step = 0
-        self.total_steps = []
         self.skip_visualization = False # Initialize the attribute
+        self._info_html_cache: Dict[str, str] = {}
         
-        # Timer for step-by-step execution
-        self.step_timer = QTimer()
-        self.step_timer.timeout.connect(self._execute_next_step)
+        # Worker thread that advances the algorithm between displayed steps
+        self._worker: Optional[AlgorithmWorker] = None
+        self._worker_thread: Optional[QThread] = None
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_worker)
         
         self._setup_ui()
         self._load_algorithms()
@@ -124,6 +216,9 @@ class AlgorithmPanel(QWidget):
         self.step_text = QTextEdit()
         self.step_text.setReadOnly(True)
         self.step_text.setMaximumHeight(150)
+        # Steps are appended one block each; keep only the latest ones
+        self.step_text.document().setMaximumBlockCount(200)
+        self._step_cursor = QTextCursor(self.step_text.document())
         step_layout.addWidget(self.step_text)
         
         layout.addWidget(step_group)
@@ -194,8 +289,11 @@ class AlgorithmPanel(QWidget):
     def _load_algorithms(self):
         """Load available algorithms into combo box"""
         algorithms = get_available_algorithms()
+        # Fill the combo box silently; the info is shown once below
+        self.algorithm_combo.blockSignals(True)
         for name in algorithms.keys():
             self.algorithm_combo.addItem(name)
+        self.algorithm_combo.blockSignals(False)
         
         if algorithms:
             self._on_algorithm_changed(list(algorithms.keys())[0])
@@ -204,13 +302,17 @@ class AlgorithmPanel(QWidget):
         """Handle algorithm selection change"""
         if algorithm_name:
             try:
-                info = get_algorithm_info(algorithm_name)
-                info_text = f"""<b>{info['name']}</b><br>
-                <b>Description:</b> {info['description']}<br>
-                <b>Time Complexity:</b> {info['time_complexity']}<br>
-                <b>Approximation Ratio:</b> {info.get('approximation_ratio', 'N/A')}<br>
-                <b>Optimal:</b> {'Yes' if info['optimal'] else 'No'}
-                """
+                # The algorithm list is static, so format each info once
+                info_text = self._info_html_cache.get(algorithm_name)
+                if info_text is None:
+                    info = get_algorithm_info(algorithm_name)
+                    info_text = f"""<b>{info['name']}</b><br>
+                    <b>Description:</b> {info['description']}<br>
+                    <b>Time Complexity:</b> {info['time_complexity']}<br>
+                    <b>Approximation Ratio:</b> {info.get('approximation_ratio', 'N/A')}<br>
+                    <b>Optimal:</b> {'Yes' if info['optimal'] else 'No'}
+                    """
+                    self._info_html_cache[algorithm_name] = info_text
                 self.info_text.setHtml(info_text)
             except Exception as e:
                 self.info_text.setText(f"Error loading algorithm info: {e}")
@@ -222,7 +324,9 @@ class AlgorithmPanel(QWidget):
     
     def _run_algorithm(self):
         """Start running the selected algorithm"""
-        if not self.graph or len(self.graph.get_edges()) == 0:
+        # Edits the window has not passed on yet would reset the new run
+        self.run_requested.emit()
+        if not self.graph or self.graph.edge_count() == 0:
             self.step_text.setText("Please create a graph with edges first.")
             return
         
@@ -235,7 +339,6 @@ class AlgorithmPanel(QWidget):
 
         self.is_running = True
         self.current_step = 0
-        self.total_steps = []
         self.progress_label.setText("Running algorithm...")
         self.step_text.clear()
         self.results_text.clear()
@@ -249,66 +352,94 @@ class AlgorithmPanel(QWidget):
         self.skip_visualization_checkbox.setEnabled(False)
 
         try:
-            self.algorithm_generator = run_algorithm(
-                self.algorithm_combo.currentText(), self.graph
-            )
-
             if self.skip_visualization:
-                # Run instantly without visualization steps
-                while True:
-                    try:
-                        next(self.algorithm_generator)
-                    except StopIteration as e:
-                        result = e.value
-                        self._algorithm_finished(result)
-                        break
-            elif self.speed_spinbox.value() == 0:
-                # Run instantly if speed is 0 (but with visualization)
-                while True:
-                    self._execute_next_step()
-            else:
-                self.step_timer.start(self.speed_spinbox.value())
+                # Run instantly without creating any visualization steps
+                result = run_algorithm_fast(algorithm_name, self.graph)
+                self._algorithm_finished(result)
+                return
+
+            # The worker reads the graph off the GUI thread while the canvas
+            # may still be edited, so it gets a copy taken here; the Graph
+            # itself must only be used from the GUI thread
+            self._start_worker(run_algorithm(algorithm_name, self.graph.copy()))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to start algorithm: {e}")
             self._reset_algorithm()
     
+    def _start_worker(self, generator: Generator[StepResult, None, VertexCoverResult]):
+        """Start advancing an algorithm generator on a worker thread"""
+        self._stop_worker()
+        self._worker = AlgorithmWorker(generator, self.speed_spinbox.value())
+        self._worker_thread = QThread(self)
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.started.connect(self._worker.run)
+        self._worker.step_ready.connect(self._on_step_ready)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.failed.connect(self._on_worker_failed)
+        self._worker_thread.start()
+    
+    def _stop_worker(self):
+        """Stop the worker thread, if any, and wait for it to exit"""
+        if self._worker is None:
+            return
+        self._worker.stop()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        self._worker = None
+        self._worker_thread = None
+    
     def _execute_next_step(self):
         """Execute the next step of the algorithm"""
-        if not self.algorithm_generator:
+        if self._worker:
+            self._worker.request_step()
+    
+    def _on_step_ready(self, step_result: StepResult):
+        """Show a step produced by the worker"""
+        if self.sender() is not self._worker:
+            return  # A step from a run that was already stopped
+        
+        self.current_step += 1
+        
+        # Update progress
+        self.progress_label.setText(f"Step {self.current_step}: {step_result.message}")
+        
+        # Append the step information, parsing only the new entry
+        cover_ids = ", ".join(map(str, sorted(v.id for v in step_result.vertex_cover_so_far)))
+        step_info = f"""<b>Step {self.current_step}:</b> {step_result.message}<br>
+        <b>Current Vertex Cover:</b> {{{cover_ids}}}<br>
+        <b>Remaining Edges:</b> {len(step_result.remaining_edges)}
+        """
+        cursor = self._step_cursor
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.step_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertHtml(step_info)
+        scroll_bar = self.step_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+        
+        # Emit signal for visualization update
+        self.algorithm_step.emit(step_result)
+        
+        # The step is on screen, so the worker may compute the next one
+        self._worker.step_displayed()
+    
+    def _on_worker_finished(self, result: VertexCoverResult):
+        """Handle the worker reaching the end of the algorithm"""
+        if self.sender() is not self._worker:
             return
-        
-        try:
-            # Get next step
-            step_result = next(self.algorithm_generator)
-            self.current_step += 1
-            self.total_steps.append(step_result)
-            
-            # Update progress
-            self.progress_label.setText(f"Step {self.current_step}: {step_result.message}")
-            
-            # Update step information
-            step_info = f"""<b>Step {self.current_step}:</b><br>
-            {step_result.message}<br><br>
-            <b>Current Vertex Cover:</b> {[v.id for v in step_result.vertex_cover_so_far]}<br>
-            <b>Remaining Edges:</b> {len(step_result.remaining_edges)}
-            """
-            self.step_text.setHtml(step_info)
-            
-            # Emit signal for visualization update
-            self.algorithm_step.emit(step_result)
-            
-        except StopIteration as e:
-            # Algorithm finished
-            result = e.value
-            self._algorithm_finished(result)
-        except Exception as e:
-            self.step_text.setText(f"Error executing step: {e}")
-            self._pause_algorithm()
+        self._stop_worker()
+        self._algorithm_finished(result)
+    
+    def _on_worker_failed(self, message: str):
+        """Handle an exception raised while computing a step"""
+        if self.sender() is not self._worker:
+            return
+        self.step_text.setText(f"Error executing step: {message}")
+        self._pause_algorithm()
     
     def _algorithm_finished(self, result: VertexCoverResult):
         """Handle algorithm completion"""
         self.is_running = False
-        self.step_timer.stop()
         
         # Update UI state
         self.run_button.setEnabled(True)
@@ -329,14 +460,16 @@ class AlgorithmPanel(QWidget):
     def _pause_algorithm(self):
         """Pause algorithm execution"""
         if self.is_running:
-            self.step_timer.stop()
+            if self._worker:
+                self._worker.pause()
             self.run_button.setText("Resume")
             self.run_button.setEnabled(True)
             self.pause_button.setEnabled(False)
             self.progress_label.setText("Algorithm paused")
         else:
             # Resume
-            self.step_timer.start(self.speed_spinbox.value())
+            if self._worker:
+                self._worker.resume()
             self.run_button.setText("Run Algorithm")
             self.run_button.setEnabled(False)
             self.pause_button.setEnabled(True)
@@ -344,13 +477,16 @@ class AlgorithmPanel(QWidget):
         
         self.is_running = not self.is_running
     
+    def reset(self):
+        """Reset the algorithm state and ask for its results to be cleared from view"""
+        self._reset_algorithm()
+        self.reset_requested.emit()
+    
     def _reset_algorithm(self):
         """Reset algorithm state"""
-        self.step_timer.stop()
-        self.algorithm_generator = None
+        self._stop_worker()
         self.is_running = False
         self.current_step = 0
-        self.total_steps = []
         
         # Reset UI state
         self.speed_spinbox.setEnabled(True)
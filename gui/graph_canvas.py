@@ -4,18 +4,22 @@ Interactive graph canvas for vertex cover visualization
 """
 
 from PyQt6.QtWidgets import QWidget, QApplication
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QMouseEvent, QPaintEvent, QLinearGradient
-from typing import Optional, Set
-from models import Graph, Vertex, Edge
+from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QLineF, QRect, QRectF, QTimer
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QMouseEvent, QPaintEvent, QLinearGradient, QGradient, QRegion
+from typing import AbstractSet, List, Optional, Set, Tuple
+import numpy as np
+from models import Graph, Vertex, Edge, StepResult
+
+# Shared by every empty highlight, since the canvas never modifies them
+_EMPTY: AbstractSet = frozenset()
 
 class GraphCanvas(QWidget):
     """Interactive canvas for drawing and editing graphs"""
     
     # Signals
-    graph_changed = pyqtSignal()
-    vertex_selected = pyqtSignal(Vertex)
-    edge_selected = pyqtSignal(Edge)
+    graph_changed = pyqtSignal()  # Vertices or edges were added or removed
+    graph_moved = pyqtSignal()  # Vertices were moved; the structure is the same
+    selection_changed = pyqtSignal(object)  # The selected Vertex or Edge
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -39,6 +43,25 @@ class GraphCanvas(QWidget):
         self.edge_removed_color = QColor(200, 200, 200)
         self.background_color = QColor(61, 64, 62)
         
+        # Pens are fixed, so build them once and reuse them on every paint
+        self._edge_pens = {
+            "normal": QPen(self.edge_color, 2),
+            "removed": QPen(self.edge_removed_color, 2, Qt.PenStyle.DashLine),
+            "highlighted": QPen(self.edge_selected_color, 3, Qt.PenStyle.SolidLine),
+            "selected": QPen(self.edge_selected_color, 3, Qt.PenStyle.DotLine),  # Different style for selected edge
+        }
+        self._vertex_outline_pen = QPen(Qt.GlobalColor.transparent, 0)
+        self._vertex_text_pen = QPen(Qt.GlobalColor.white)
+        self._edge_preview_pen = QPen(self.edge_selected_color, 2, Qt.PenStyle.DashLine)
+        
+        # Default vertex fill, shared by every vertex: in object bounding
+        # mode the gradient is relative to each ellipse it fills
+        self._default_gradient = QLinearGradient(0, 0, 1, 1)
+        self._default_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+        self._default_gradient.setColorAt(0, self.vertex_color)
+        self._default_gradient.setColorAt(1, self.vertex_gradient_color)
+        self._default_brush = QBrush(self._default_gradient)
+        
         # Interaction state
         self.mode = "add_vertex"  # "add_vertex", "add_edge", "select", "delete"
         self.selected_vertex = None
@@ -46,13 +69,28 @@ class GraphCanvas(QWidget):
         self.edge_start_vertex = None
         self.dragging_vertex = None
         self.drag_offset = QPointF(0, 0)
+        self._drag_neighbors: List[Vertex] = []
+        
+        # Edge endpoints as an (E, 4) array of x1, y1, x2, y2 for hit-testing,
+        # rebuilt when the graph's edges change or a vertex is dragged
+        self._edge_list: List[Edge] = []
+        self._edge_xy = np.empty((0, 4))
+        self._edge_xy_source = None
         
         # Visualization state
-        self.vertex_cover = set()
-        self.highlighted_edges = set()
-        self.removed_edges = set()
-        self.added_vertices = set()
+        self.vertex_cover = _EMPTY
+        self.highlighted_edges = _EMPTY
+        self.removed_edges = _EMPTY
+        self.added_vertices = _EMPTY
         self.hovered_vertex: Optional[Vertex] = None
+        
+        # Last local mouse position, used by hover hit-testing (at most once
+        # per timer interval) and by the edge preview
+        self._last_mouse_pos = QPointF(0, 0)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._update_hovered_vertex)
 
         self.setStyleSheet("""
             GraphCanvas {
@@ -72,41 +110,123 @@ class GraphCanvas(QWidget):
     
     def clear_graph(self):
         """Clear the graph"""
+        # Clear in place: other components hold on to this Graph object
         self.graph.clear()
+        # Let go of every reference to the old vertices and edges
+        self.edge_start_vertex = None
+        self.dragging_vertex = None
+        self._drag_neighbors = []
+        self.hovered_vertex = None
+        self._edge_list = []
+        self._edge_xy = np.empty((0, 4))
+        self._edge_xy_source = None
         self.clear_visualization_state()
+        self.update()  # Everything is gone, not just the highlights
         self.graph_changed.emit()
-        self.update()
     
     def clear_visualization_state(self):
         """Clear visualization highlighting"""
-        self.vertex_cover.clear()
-        self.highlighted_edges.clear()
-        self.removed_edges.clear()
-        self.added_vertices.clear()
+        vertices = set(self.vertex_cover)
+        if self.selected_vertex is not None:
+            vertices.add(self.selected_vertex)
+        edges = {self.selected_edge} if self.selected_edge is not None else set()
+        self.vertex_cover = _EMPTY
         self.selected_vertex = None
         self.selected_edge = None
-        self.update()
+        self._clear_highlights(vertices, edges)
+    
+    def reset_highlights(self):
+        """Clear the per-step edge and vertex highlights, keeping the vertex cover"""
+        self._clear_highlights(set(), set())
     
-    def set_vertex_cover(self, vertex_cover: Set[Vertex]):
+    def _clear_highlights(self, vertices: Set[Vertex], edges: Set[Edge]):
+        """Clear the per-step highlights, repainting them along with the given items"""
+        vertices.update(self.added_vertices)
+        edges.update(self.highlighted_edges)
+        edges.update(self.removed_edges)
+        # Reassign rather than clear(): the sets may be read-only step snapshots
+        self.highlighted_edges = _EMPTY
+        self.removed_edges = _EMPTY
+        self.added_vertices = _EMPTY
+        dirty = self._dirty_rect(vertices, edges)
+        if dirty is not None:
+            self.update(dirty)
+    
+    # The setters keep the given sets without copying them, so callers must
+    # hand over sets they no longer modify (algorithm steps are snapshots)
+    
+    def set_vertex_cover(self, vertex_cover: AbstractSet[Vertex]):
         """Set vertices to highlight as part of vertex cover"""
-        self.vertex_cover = vertex_cover.copy()
+        if vertex_cover == self.vertex_cover:
+            return
+        self.vertex_cover = vertex_cover
         self.update()
     
-    def set_highlighted_edges(self, edges: Set[Edge]):
+    def set_highlighted_edges(self, edges: AbstractSet[Edge]):
         """Set edges to highlight"""
-        self.highlighted_edges = edges.copy()
+        if edges == self.highlighted_edges:
+            return
+        self.highlighted_edges = edges
         self.update()
     
-    def set_removed_edges(self, edges: Set[Edge]):
+    def set_removed_edges(self, edges: AbstractSet[Edge]):
         """Set edges to show as removed"""
-        self.removed_edges = edges.copy()
+        if edges == self.removed_edges:
+            return
+        self.removed_edges = edges
         self.update()
     
-    def set_added_vertices(self, vertices: Set[Vertex]):
+    def set_added_vertices(self, vertices: AbstractSet[Vertex]):
         """Set vertices to highlight as newly added"""
-        self.added_vertices = vertices.copy()
+        if vertices == self.added_vertices:
+            return
+        self.added_vertices = vertices
         self.update()
     
+    def apply_step(self, step_result: StepResult):
+        """Show the state of an algorithm step, repainting only what it changed"""
+        vertex_cover = step_result.vertex_cover_so_far
+        if step_result.selected_edge:
+            highlighted_edges = {step_result.selected_edge}
+        else:
+            highlighted_edges = _EMPTY
+        # Removed edges and added vertices stay shown until a step changes them
+        removed_edges = step_result.removed_edges or self.removed_edges
+        added_vertices = step_result.added_vertices or self.added_vertices
+        
+        changed_vertices = set(self.vertex_cover).symmetric_difference(vertex_cover)
+        changed_vertices.update(set(self.added_vertices).symmetric_difference(added_vertices))
+        changed_edges = set(self.highlighted_edges).symmetric_difference(highlighted_edges)
+        changed_edges.update(set(self.removed_edges).symmetric_difference(removed_edges))
+        
+        self.vertex_cover = vertex_cover
+        self.highlighted_edges = highlighted_edges
+        self.removed_edges = removed_edges
+        self.added_vertices = added_vertices
+        
+        dirty = self._dirty_rect(changed_vertices, changed_edges)
+        if dirty is not None:
+            self.update(dirty)
+    
+    def _dirty_rect(self, vertices: Set[Vertex], edges: Set[Edge]) -> Optional[QRect]:
+        """Get the bounding box of the given vertices and edges, or None if both are empty"""
+        # Step results come from a copy of the graph, so their positions may
+        # be stale; take the positions of the canvas's own vertices instead
+        vertex_by_id = self.graph.get_vertex_by_id
+        endpoints = [vertex_by_id(vertex.id) for vertex in vertices]
+        for edge in edges:
+            endpoints += (vertex_by_id(edge.u.id), vertex_by_id(edge.v.id))
+        if not endpoints:
+            return None
+        if None in endpoints:
+            return self.rect()  # Unknown to the canvas graph, repaint everything
+        xs = [vertex.x for vertex in endpoints]
+        ys = [vertex.y for vertex in endpoints]
+        margin = self.vertex_radius + 3  # Vertex circle plus the widest pen
+        return QRectF(QPointF(min(xs), min(ys)), QPointF(max(xs), max(ys))).adjusted(
+            -margin, -margin, margin, margin
+        ).toAlignedRect()
+    
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press events"""
         pos = event.position()
@@ -143,20 +263,24 @@ class GraphCanvas(QWidget):
             
             elif self.mode == "select":
                 if clicked_vertex:
-                    self.selected_vertex = clicked_vertex
-                    self.selected_edge = None
-                    self.vertex_selected.emit(clicked_vertex)
+                    # Pressing the current selection again only starts a drag
+                    if clicked_vertex is not self.selected_vertex:
+                        self.selected_vertex = clicked_vertex
+                        self.selected_edge = None
+                        self.selection_changed.emit(clicked_vertex)
                     # Start dragging
                     self.dragging_vertex = clicked_vertex
                     self.drag_offset = QPointF(x - clicked_vertex.x, y - clicked_vertex.y)
+                    self._drag_neighbors = list(self.graph.get_neighbors(clicked_vertex))
                 else:
                     # Check if clicked on edge
                     self.dragging_vertex = None # Ensure dragging is off if clicking background
                     clicked_edge = self._find_edge_at_position(x, y)
                     if clicked_edge:
-                        self.selected_edge = clicked_edge
-                        self.selected_vertex = None
-                        self.edge_selected.emit(clicked_edge)
+                        if clicked_edge != self.selected_edge:
+                            self.selected_edge = clicked_edge
+                            self.selected_vertex = None
+                            self.selection_changed.emit(clicked_edge)
                     else:
                         self.selected_vertex = None
                         self.selected_edge = None
@@ -179,81 +303,99 @@ class GraphCanvas(QWidget):
     
     def mouseMoveEvent(self, event: QMouseEvent):
         """Handle mouse move events"""
+        self._last_mouse_pos = event.position()
         if self.dragging_vertex and self.mode == "select":
             pos = event.position()
             new_x = pos.x() - self.drag_offset.x()
             new_y = pos.y() - self.drag_offset.y()
             
-            # Update vertex position
-            # Since Vertex is immutable, we need to recreate it
-            old_vertex = self.dragging_vertex
-            new_vertex = Vertex(old_vertex.id, new_x, new_y)
-            
-            # Update graph
-            self.graph._vertices.remove(old_vertex)
-            self.graph._vertices.add(new_vertex)
-            
-            # Update edges
-            edges_to_update = []
-            for edge in self.graph._edges:
-                if edge.u == old_vertex or edge.v == old_vertex:
-                    edges_to_update.append(edge)
-            
-            for edge in edges_to_update:
-                self.graph._edges.remove(edge)
-                new_u = new_vertex if edge.u == old_vertex else edge.u
-                new_v = new_vertex if edge.v == old_vertex else edge.v
-                self.graph._edges.add(Edge(new_u, new_v))
-            
-            # Update references
-            self.dragging_vertex = new_vertex
-            if self.selected_vertex == old_vertex:
-                self.selected_vertex = new_vertex
+            # Update vertex position in place; edges share the same object
+            old_region = self._drag_region()
+            self.graph.move_vertex(self.dragging_vertex, new_x, new_y)
+            self._edge_xy_source = None
             
             self.hovered_vertex = None # Clear hover while dragging
-            self.update()
+            # Only the dragged vertex and its edges need repainting
+            self.update(old_region.united(self._drag_region()))
         elif self.mode != "delete": # Don't highlight vertex on hover in delete mode
-            # Update hovered vertex for visual feedback
-            pos = event.position()
-            x, y = pos.x(), pos.y()
-            hovered = self.graph.get_vertex_at_position(x, y, self.vertex_radius)
-            if hovered != self.hovered_vertex:
-                self.hovered_vertex = hovered
+            # Update hovered vertex for visual feedback, coalescing fast motion
+            if not self._hover_timer.isActive():
+                self._hover_timer.start()
+            if self.edge_start_vertex:
+                self.update()  # The edge preview follows the mouse
+    
+    def _drag_region(self) -> QRegion:
+        """Get the area covered by the dragged vertex and its incident edges"""
+        vertex = self.dragging_vertex
+        margin = self.vertex_radius + 3  # Vertex circle plus the widest pen
+        region = QRegion(self._vertex_rect(vertex))
+        for neighbor in self._drag_neighbors:
+            region = region.united(
+                QRectF(QPointF(vertex.x, vertex.y), QPointF(neighbor.x, neighbor.y))
+                .normalized()
+                .adjusted(-margin, -margin, margin, margin)
+                .toAlignedRect()
+            )
+        return region
+    
+    def _update_hovered_vertex(self):
+        """Hit-test the last mouse position and repaint if the hover changed"""
+        if self.dragging_vertex or self.mode == "delete":
+            return
+        x, y = self._last_mouse_pos.x(), self._last_mouse_pos.y()
+        hovered = self.graph.get_vertex_at_position(x, y, self.vertex_radius)
+        if hovered is not self.hovered_vertex:
+            # Only the previously and newly hovered vertices change colour
+            for vertex in (self.hovered_vertex, hovered):
+                if vertex is not None:
+                    self.update(self._vertex_rect(vertex))
+            self.hovered_vertex = hovered
+    
+    def _vertex_rect(self, vertex: Vertex) -> QRect:
+        """Get the area covered by a vertex circle and its outline"""
+        margin = self.vertex_radius + 3  # Vertex circle plus the widest pen
+        return QRect(int(vertex.x) - margin, int(vertex.y) - margin, 2 * margin, 2 * margin)
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release events"""
         if self.dragging_vertex:
             self.dragging_vertex = None
-            self.graph_changed.emit()
+            self._drag_neighbors = []
+            self.graph_moved.emit()
+    
+    def _edge_geometry(self) -> Tuple[List[Edge], np.ndarray]:
+        """Get the edges and their endpoint array, rebuilding them if stale"""
+        edges_soa = self.graph.edges_soa()
+        if edges_soa is not self._edge_xy_source:
+            self._edge_list = list(self.graph.get_edges())
+            self._edge_xy = np.array(
+                [(edge.u.x, edge.u.y, edge.v.x, edge.v.y) for edge in self._edge_list],
+                dtype=np.float64
+            ).reshape(-1, 4)
+            self._edge_xy_source = edges_soa
+        return self._edge_list, self._edge_xy
     
     def _find_edge_at_position(self, x: float, y: float, tolerance: float = 5.0) -> Optional[Edge]:
-        """Find edge near the given position"""
-        for edge in self.graph.get_edges():
-            # Calculate distance from point to line segment
-            x1, y1 = edge.u.x, edge.u.y
-            x2, y2 = edge.v.x, edge.v.y
-            
-            # Vector from start to end
-            dx = x2 - x1
-            dy = y2 - y1
-            
-            if dx == 0 and dy == 0:
-                # Degenerate case
-                distance = ((x - x1) ** 2 + (y - y1) ** 2) ** 0.5
-            else:
-                # Parameter t for closest point on line
-                t = max(0, min(1, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
-                
-                # Closest point on line segment
-                closest_x = x1 + t * dx
-                closest_y = y1 + t * dy
-                
-                # Distance to closest point
-                distance = ((x - closest_x) ** 2 + (y - closest_y) ** 2) ** 0.5
-            
-            if distance <= tolerance:
-                return edge
+        """Find the edge nearest to the given position, within tolerance"""
+        edges, edge_xy = self._edge_geometry()
+        if not edges:
+            return None
         
+        # Distance from the point to every segment at once
+        x1, y1, x2, y2 = edge_xy.T
+        dx = x2 - x1
+        dy = y2 - y1
+        
+        # Parameter t of the closest point on each segment; degenerate
+        # segments have zero length, so t stays 0 and the start point is used
+        length_squared = dx * dx + dy * dy
+        t = np.clip(((x - x1) * dx + (y - y1) * dy) / np.maximum(length_squared, 1e-12), 0.0, 1.0)
+        
+        # Compare squared distances to avoid the square roots
+        distance_squared = (x - (x1 + t * dx)) ** 2 + (y - (y1 + t * dy)) ** 2
+        nearest = int(np.argmin(distance_squared))
+        if distance_squared[nearest] <= tolerance * tolerance:
+            return edges[nearest]
         return None
     
     def paintEvent(self, event: QPaintEvent):
@@ -261,76 +403,104 @@ class GraphCanvas(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw background gradient
-        # Using a subtle linear gradient for a modern look
-        gradient = QColor(61, 64, 62)
-        painter.fillRect(self.rect(), gradient)
-
-        # Original fill for compatibility, can be removed if gradient is preferred
-        painter.fillRect(self.rect(), self.background_color)
+        # Only the dirty area is repainted, so skip whatever lies outside it
+        dirty = QRectF(event.rect())
+        
+        # Draw background
+        painter.fillRect(dirty, self.background_color)
         
         # Draw edges
-        self._draw_edges(painter)
+        self._draw_edges(painter, dirty)
         
         # Draw vertices
-        self._draw_vertices(painter)
+        self._draw_vertices(painter, dirty)
         
         # Draw edge being created
         if self.mode == "add_edge" and self.edge_start_vertex:
             self._draw_edge_preview(painter)
     
-    def _draw_edges(self, painter: QPainter):
-        """Draw all edges"""
+    def _draw_edges(self, painter: QPainter, dirty: QRectF):
+        """Draw the edges that cross the dirty area"""
+        # Widen the area by half of the widest pen
+        left, top = dirty.left() - 2, dirty.top() - 2
+        right, bottom = dirty.right() + 2, dirty.bottom() + 2
+        
+        # Group the edges by style so each pen is set once per paint
+        groups = {style: [] for style in self._edge_pens}
         for edge in self.graph.get_edges():
-            # Determine edge color and style
+            u, v = edge.u, edge.v
+            if (max(u.x, v.x) < left or min(u.x, v.x) > right or
+                    max(u.y, v.y) < top or min(u.y, v.y) > bottom):
+                continue  # Bounding box misses the dirty area
+            
             if edge in self.removed_edges:
-                pen = QPen(self.edge_removed_color, 2, Qt.PenStyle.DashLine)
+                style = "removed"
             elif edge in self.highlighted_edges:
-                pen = QPen(self.edge_selected_color, 3, Qt.PenStyle.SolidLine)
+                style = "highlighted"
             elif edge == self.selected_edge:
-                 pen = QPen(self.edge_selected_color, 3, Qt.PenStyle.DotLine) # Different style for selected edge
+                style = "selected"
             else:
-                pen = QPen(self.edge_color, 2)
-            
-            painter.setPen(pen)
-            painter.drawLine(int(edge.u.x), int(edge.u.y), int(edge.v.x), int(edge.v.y))
-
+                style = "normal"
+            groups[style].append(QLineF(u.x, u.y, v.x, v.y))
+        
+        for style, lines in groups.items():
+            if lines:
+                painter.setPen(self._edge_pens[style])
+                painter.drawLines(lines)
     
-    def _draw_vertices(self, painter: QPainter):
-        """Draw all vertices"""
+    def _draw_vertices(self, painter: QPainter, dirty: QRectF):
+        """Draw the vertices that overlap the dirty area"""
         font = QFont("Arial", 12, QFont.Weight.Bold)
         painter.setFont(font)
         
-        for vertex in self.graph.get_vertices():
-            # Determine vertex color and brush
+        margin = self.vertex_radius + 1
+        left, top = dirty.left() - margin, dirty.top() - margin
+        right, bottom = dirty.right() + margin, dirty.bottom() + margin
+        vertices = self.graph.get_vertices_in_rect(left, top, right, bottom)
+        # Sort by id so overlapping vertices of the same kind stack the same
+        # way in every repaint, however small
+        vertices.sort(key=lambda vertex: vertex.id)
+        
+        # Group the vertices by fill so each brush is set once per paint
+        selected, hovered, covered, added, default = [], [], [], [], []
+        for vertex in vertices:
             if vertex == self.selected_vertex:
-                brush = QBrush(self.vertex_selected_color)
-            elif vertex == self.hovered_vertex:
-                brush = QBrush(self.vertex_hover_color)
+                selected.append(vertex)
+            elif vertex is self.hovered_vertex:
+                hovered.append(vertex)
             elif vertex in self.vertex_cover:
-                brush = QBrush(self.vertex_cover_color)
+                covered.append(vertex)
             elif vertex in self.added_vertices:
-                brush = QBrush(self.vertex_selected_color) # Highlight newly added vertices
+                added.append(vertex)  # Highlight newly added vertices
             else:
-                # Apply gradient for default vertices
-                gradient = QLinearGradient(vertex.x - self.vertex_radius, vertex.y - self.vertex_radius,
-                                           vertex.x + self.vertex_radius, vertex.y + self.vertex_radius)
-                gradient.setColorAt(0, self.vertex_color)
-                gradient.setColorAt(1, self.vertex_gradient_color)
-                brush = QBrush(gradient)
-            
-            # Draw vertex circle
-            painter.setPen(QPen(Qt.GlobalColor.transparent, 0)) # Remove outline
-            painter.setBrush(brush)
-            painter.drawEllipse(
-                int(vertex.x - self.vertex_radius),
-                int(vertex.y - self.vertex_radius),
-                self.vertex_radius * 2,
-                self.vertex_radius * 2
-            )
-            
-            # Draw vertex ID
-            painter.setPen(QPen(Qt.GlobalColor.white)) # Change text color to white
+                default.append(vertex)
+        
+        # Draw vertex circles without an outline. Default vertices go first
+        # and the groups follow in rising priority, so a highlighted vertex
+        # stays on top of the vertices it overlaps; within a group, the
+        # higher id is on top
+        painter.setPen(self._vertex_outline_pen)
+        diameter = self.vertex_radius * 2
+        for group, brush in (
+            (default, self._default_brush),  # One gradient shared by every vertex
+            (added, QBrush(self.vertex_selected_color)),
+            (covered, QBrush(self.vertex_cover_color)),
+            (hovered, QBrush(self.vertex_hover_color)),
+            (selected, QBrush(self.vertex_selected_color)),
+        ):
+            if group:
+                painter.setBrush(brush)
+                for vertex in group:
+                    painter.drawEllipse(
+                        int(vertex.x - self.vertex_radius),
+                        int(vertex.y - self.vertex_radius),
+                        diameter,
+                        diameter
+                    )
+        
+        # Draw vertex IDs
+        painter.setPen(self._vertex_text_pen) # White text
+        for vertex in vertices:
             painter.drawText(
                 int(vertex.x - 10),
                 int(vertex.y + 5),
@@ -340,8 +510,8 @@ class GraphCanvas(QWidget):
     def _draw_edge_preview(self, painter: QPainter):
         """Draw edge being created"""
         if self.edge_start_vertex:
-            painter.setPen(QPen(self.edge_selected_color, 2, Qt.PenStyle.DashLine))
-            mouse_pos = self.mapFromGlobal(self.cursor().pos())
+            painter.setPen(self._edge_preview_pen)
+            mouse_pos = self._last_mouse_pos
             painter.drawLine(
                 int(self.edge_start_vertex.x),
                 int(self.edge_start_vertex.y),
@@ -4,24 +4,245 @@ Main window for vertex cover visualization tool
 """
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
+    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
     QMenuBar, QMenu, QToolBar, QStatusBar, QMessageBox, QFileDialog,
     QButtonGroup, QPushButton, QLabel, QGroupBox
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QAction, QIcon, QPixmap, QPainter
+from PyQt6.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QAction, QIcon, QImage, QImageWriter, QPalette, QPixmap, QPainter
 from .graph_canvas import GraphCanvas
 from .algorithm_panel import AlgorithmPanel
-from models import StepResult, VertexCoverResult
+from models import StepResult, Vertex, VertexCoverResult
+import functools
 import json
+import re
+from typing import List
 from PyQt6.QtGui import QLinearGradient, QColor, QBrush
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dump_json(data) -> bytes:
+    """Encode data as indented JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+def _read_json(filename: str):
+    """Read and parse a JSON file, with orjson when it is installed"""
+    with open(filename, 'rb') as f:
+        content = f.read()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _write_json(filename: str, data):
+    """Encode data and write it to a JSON file"""
+    with open(filename, 'wb') as f:
+        f.write(_dump_json(data))
+
+def _write_image(filename: str, image: QImage):
+    """Encode an image and write it to a file, in the format its suffix names"""
+    writer = QImageWriter(filename)
+    writer.setCompression(1)  # Fast compression; exports favour speed over size
+    if not writer.write(image):
+        raise OSError(writer.errorString())
+
+
+class _FileTaskSignals(QObject):
+    """Signals of a _FileTask, delivered on the GUI thread"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _FileTask(QRunnable):
+    """Runs a file operation on the thread pool and reports the outcome"""
+    
+    def __init__(self, function, *args):
+        super().__init__()
+        self.setAutoDelete(False)  # The window keeps the task until it reports back
+        self.signals = _FileTaskSignals()
+        self._function = function
+        self._args = args
+    
+    def run(self):
+        try:
+            result = self._function(*self._args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and collapse whitespace so Qt parses a compact stylesheet"""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", qss).strip()
+
+# Application stylesheet, minified once at import time
+_STYLESHEET = _minify_qss("""
+/* --- General Styles --- */
+QMainWindow {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                               stop:0 #1E1E2E, /* Dark base */
+                               stop:1 #282838); /* Slightly lighter */
+}
+
+/* --- Menu Bar --- */
+QMenuBar {
+    background-color: #282838; /* Match window gradient start */
+    color: #E0E0E0;
+    border-bottom: none; /* Remove border */
+}
+QMenuBar::item {
+    background-color: transparent;
+    color: #E0E0E0;
+    padding: 4px 10px;
+}
+QMenuBar::item:selected {
+    background-color: rgba(80, 80, 100, 0.3); /* Subtle highlight */
+    border-radius: 4px;
+}
+
+/* --- Menu --- */
+QMenu {
+    background-color: #353545; /* Slightly darker than window */
+    color: #E0E0E0;
+    border: 1px solid #454555;
+    border-radius: 4px;
+}
+ QMenu::separator {
+    height: 1px;
+    background-color: #454555;
+    margin-left: 10px;
+    margin-right: 10px;
+}
+ QMenu::item {
+    padding: 5px 20px 5px 10px;
+}
+QMenu::item:selected {
+    background-color: rgba(80, 80, 100, 0.5);
+     border-radius: 4px;
+}
+
+/* --- Tool Bar --- */
+QToolBar {
+    background-color: #282838;
+    color: #E0E0E0;
+    border-bottom: none;
+    spacing: 10px; /* Space between tool buttons */
+}
+
+/* --- Group Box --- */
+QGroupBox {
+    font-weight: bold;
+    color: #E0E0E0;
+    border: 1px solid #454555;
+    border-radius: 5px;
+    margin-top: 1ex;
+    padding-top: 10px;
+    background-color: rgba(40, 40, 50, 0.5); /* Semi-transparent background */
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+    color: #B0B0B0; /* Slightly lighter title color */
+}
+
+/* --- Labels --- */
+#left_panel QLabel, #right_panel QLabel {
+    color: #E0E0E0;
+}
+
+/* --- Tool Buttons --- */
+QPushButton#toolBtn {
+    background-color: #5A5A5A; /* Neutral grey button */
+    border: none;
+    color: white;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton#toolBtn:hover {
+    background-color: #45a049;
+}
+QPushButton#toolBtn:pressed {
+    background-color: #3d8b40;
+}
+QPushButton#toolBtn:checked {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                               stop:0 #6A1B9A, /* Purple start */
+                               stop:1 #AB47BC); /* Lighter purple end */
+     color: white;
+}
+QPushButton#toolBtn:disabled {
+    background-color: #cccccc;
+    color: #666666;
+}
+QStatusBar {
+    background-color: #282838;
+    border-top: 1px solid #3A3A3A;
+}
+
+/* --- Splitter --- */
+QSplitter#main_splitter::handle {
+    background-color: #5A5A5A; /* Darker handle color */
+    width: 2px; /* Thinner handle */
+}
+""")
+
+# Text of the About dialog
+_ABOUT_HTML = """<h3>Vertex Cover Visualization Tool</h3>
+<p>A tool for visualizing vertex cover algorithms step by step.</p>
+<p><b>Features:</b></p>
+<ul>
+<li>Interactive graph creation and editing</li>
+<li>Step-by-step algorithm visualization</li>
+<li>Multiple vertex cover algorithms</li>
+<li>Graph import/export functionality</li>
+</ul>
+<p><b>Version:</b> 1.0</p>
+<p><b>Built with:</b> Python and PyQt6</p>
+"""
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Graph tool buttons as (label, canvas mode); the first one starts checked
+    _TOOLS = (
+        ("Add Vertex", "add_vertex"),
+        ("Add Edge", "add_edge"),
+        ("Select/Move", "select"),
+        ("Delete", "delete"),
+    )
+    
+    # Status bar message for every canvas mode
+    _MODE_LABELS = {
+        "add_vertex": "Mode: Add Vertex",
+        "add_edge": "Mode: Add Edge",
+        "select": "Mode: Select",
+        "delete": "Mode: Delete",
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Vertex Cover Visualization Tool")
         self.setGeometry(100, 100, 1200, 800)
+        
+        # File operations running on the thread pool
+        self._file_tasks = set()
+        # Vertex and edge counts shown in the graph info label
+        self._last_counts = (0, 0)
+        self._about_dialog = None
+        self._file_dialog = None
+        
+        # Coalesces rapid graph edits into one algorithm panel update
+        self._panel_graph_timer = QTimer(self)
+        self._panel_graph_timer.setSingleShot(True)
+        self._panel_graph_timer.setInterval(50)
+        self._panel_graph_timer.timeout.connect(self._update_panel_graph)
 
         # Create central widget and layout
         central_widget = QWidget()
@@ -32,12 +253,7 @@ class MainWindow(QMainWindow):
         
         # Create splitter for resizable panels with a modern look
         splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #5A5A5A; /* Darker handle color */
-                width: 2px; /* Thinner handle */
-            }
-        """)
+        splitter.setObjectName("main_splitter")  # Styled by _STYLESHEET
         main_layout.addWidget(splitter)
         
         # Create left panel (graph canvas and tools)
@@ -46,6 +262,7 @@ class MainWindow(QMainWindow):
         # Set initial splitter proportions
         splitter.setSizes([800, 400])
         # Setup menu bar and toolbar
+        self._build_actions()
         self._setup_menu_bar()
         self._setup_toolbar()
         self._setup_status_bar()
@@ -55,6 +272,9 @@ class MainWindow(QMainWindow):
         
         # Apply styling
         self._apply_styling()
+        
+        # Build the algorithm panel once the window has had a chance to paint
+        QTimer.singleShot(0, self._deferred_init)
 
     def _create_panels(self, splitter):
         """Create the left and right panels and add them to the splitter"""
@@ -64,12 +284,14 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(self.left_panel)
         splitter.addWidget(self.left_panel)
 
-        # Create right panel (algorithm controls)
+        # Create right panel (algorithm controls); the algorithm panel itself
+        # is built lazily, so a placeholder holds its place until then
         self.right_panel = QWidget()
         self.right_panel.setObjectName("right_panel") # Object name for styling
-        self.algorithm_panel = AlgorithmPanel()
+        self._algorithm_panel = None
+        self._algorithm_placeholder = QWidget()
         right_layout = QVBoxLayout(self.right_panel)
-        right_layout.addWidget(self.algorithm_panel)
+        right_layout.addWidget(self._algorithm_placeholder)
         splitter.addWidget(self.right_panel)
         
         # Graph editing tools
@@ -79,30 +301,20 @@ class MainWindow(QMainWindow):
         # Tool buttons
         self.tool_buttons = QButtonGroup()
         
-        self.add_vertex_btn = QPushButton("Add Vertex")
-        self.add_vertex_btn.setCheckable(True)
-        self.add_vertex_btn.setChecked(True)
-        self.tool_buttons.addButton(self.add_vertex_btn, 0)
-        tools_layout.addWidget(self.add_vertex_btn)
-        
-        self.add_edge_btn = QPushButton("Add Edge")
-        self.add_edge_btn.setCheckable(True)
-        self.tool_buttons.addButton(self.add_edge_btn, 1)
-        tools_layout.addWidget(self.add_edge_btn)
-        
-        self.select_btn = QPushButton("Select/Move")
-        self.select_btn.setCheckable(True)
-        self.tool_buttons.addButton(self.select_btn, 2)
-        tools_layout.addWidget(self.select_btn)
-        
-        self.delete_btn = QPushButton("Delete")
-        self.delete_btn.setCheckable(True)
-        self.tool_buttons.addButton(self.delete_btn, 3)
-        tools_layout.addWidget(self.delete_btn)
+        for button_id, (text, mode) in enumerate(self._TOOLS):
+            button = QPushButton(text)
+            button.setCheckable(True)
+            button.setChecked(button_id == 0)
+            button.setObjectName("toolBtn") # Object name for styling
+            button.clicked.connect(functools.partial(self._set_mode, mode))
+            self.tool_buttons.addButton(button, button_id)
+            tools_layout.addWidget(button)
+            setattr(self, f"{mode}_btn", button)
         
         tools_layout.addStretch()
         
         self.clear_btn = QPushButton("Clear Graph")
+        self.clear_btn.setObjectName("toolBtn") # Object name for styling
         self.clear_btn.clicked.connect(self._clear_graph)
         tools_layout.addWidget(self.clear_btn)
 
@@ -120,82 +332,66 @@ class MainWindow(QMainWindow):
         left_layout.addLayout(info_layout)
 
     
+    def _build_actions(self):
+        """Create the actions shared by the menu bar and the toolbar"""
+        self._actions = {}
+        
+        def add_action(key, text, slot, shortcut=None, icon_text=None):
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+                self.addAction(action)  # Works before its menu is first filled
+            if icon_text:
+                action.setIconText(icon_text)  # Shorter label for the toolbar
+            action.triggered.connect(slot)
+            self._actions[key] = action
+        
+        add_action('new', "New Graph", self._new_graph, "Ctrl+N", "New")
+        add_action('open', "Open Graph", self._open_graph, "Ctrl+O", "Open")
+        add_action('save', "Save Graph", self._save_graph, "Ctrl+S", "Save")
+        add_action('export', "Export Image", self._export_image)
+        add_action('exit', "Exit", self.close, "Ctrl+Q")
+        add_action('clear', "Clear Graph", self._clear_graph, icon_text="Clear")
+        add_action('clear_viz', "Clear Visualization", self._clear_visualization)
+        add_action('about', "About", self._show_about)
+    
+    # Contents of each menu, by action key; None stands for a separator
+    _MENUS = (
+        ("File", ('new', 'open', 'save', None, 'export', None, 'exit')),
+        ("Edit", ('clear', 'clear_viz')),
+        ("Help", ('about',)),
+    )
+    
     def _setup_menu_bar(self):
         """Setup the menu bar"""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("File")
-        
-        new_action = QAction("New Graph", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._new_graph)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("Open Graph", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self._open_graph)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("Save Graph", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self._save_graph)
-        file_menu.addAction(save_action)
-        
-        file_menu.addSeparator()
-        
-        export_action = QAction("Export Image", self)
-        export_action.triggered.connect(self._export_image)
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu("Edit")
-        
-        clear_action = QAction("Clear Graph", self)
-        clear_action.triggered.connect(self._clear_graph)
-        edit_menu.addAction(clear_action)
-        
-        clear_viz_action = QAction("Clear Visualization", self)
-        clear_viz_action.triggered.connect(self._clear_visualization)
-        edit_menu.addAction(clear_viz_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-        
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        # Menus are filled the first time they are opened
+        for title, keys in self._MENUS:
+            menu = menubar.addMenu(title)
+            menu.aboutToShow.connect(lambda menu=menu, keys=keys: self._populate_menu(menu, keys))
+    
+    def _populate_menu(self, menu: QMenu, keys):
+        """Add the actions of a menu, unless it was filled before"""
+        if not menu.isEmpty():
+            return
+        for key in keys:
+            if key is None:
+                menu.addSeparator()
+            else:
+                menu.addAction(self._actions[key])
     
     def _setup_toolbar(self):
         """Setup the toolbar"""
         toolbar = self.addToolBar("Main")
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         
-        # Add some common actions to toolbar
-        new_action = QAction("New", self)
-        new_action.triggered.connect(self._new_graph)
-        toolbar.addAction(new_action)
-        
-        open_action = QAction("Open", self)
-        open_action.triggered.connect(self._open_graph)
-        toolbar.addAction(open_action)
-        
-        save_action = QAction("Save", self)
-        save_action.triggered.connect(self._save_graph)
-        toolbar.addAction(save_action)
-        
+        # Add some common actions to toolbar, shared with the menu bar
+        toolbar.addAction(self._actions['new'])
+        toolbar.addAction(self._actions['open'])
+        toolbar.addAction(self._actions['save'])
         toolbar.addSeparator()
-        
-        clear_action = QAction("Clear", self)
-        clear_action.triggered.connect(self._clear_graph)
-        toolbar.addAction(clear_action)
+        toolbar.addAction(self._actions['clear'])
     
     def _setup_status_bar(self):
         """Setup the status bar"""
@@ -204,294 +400,288 @@ class MainWindow(QMainWindow):
     
     def _connect_signals(self):
         """Connect widget signals"""
-        # Tool button signals
-        self.tool_buttons.buttonClicked.connect(self._on_tool_changed)
-        
-        # Graph canvas signals
-        self.graph_canvas.graph_changed.connect(self._on_graph_changed)
-        self.graph_canvas.vertex_selected.connect(self._on_vertex_selected)
-        self.graph_canvas.edge_selected.connect(self._on_edge_selected)
-        
-        # Algorithm panel signals
-        self.algorithm_panel.algorithm_step.connect(self._on_algorithm_step)
-        self.algorithm_panel.algorithm_finished.connect(self._on_algorithm_finished)
+        # Graph canvas signals. The canvas and the window both live on the
+        # GUI thread, so the slots can be called directly; these emitters
+        # must stay on the GUI thread for that to remain safe.
+        direct = Qt.ConnectionType.DirectConnection
+        self.graph_canvas.graph_changed.connect(self._on_graph_changed, direct)
+        self.graph_canvas.selection_changed.connect(self._on_selection_changed, direct)
+    
+    @property
+    def algorithm_panel(self) -> AlgorithmPanel:
+        """Algorithm panel, built on first use if the deferred init has not run yet"""
+        if self._algorithm_panel is None:
+            self._deferred_init()
+        return self._algorithm_panel
+    
+    def _deferred_init(self):
+        """Replace the placeholder with the algorithm panel and connect it"""
+        if self._algorithm_panel is not None:
+            return
+        panel = AlgorithmPanel()
+        self.right_panel.layout().replaceWidget(self._algorithm_placeholder, panel)
+        self._algorithm_placeholder.deleteLater()
+        self._algorithm_placeholder = None
+        self._algorithm_panel = panel
+        
+        # Algorithm panel signals; the panel re-emits worker results from
+        # the GUI thread, so these are direct calls as well
+        direct = Qt.ConnectionType.DirectConnection
+        panel.algorithm_step.connect(self._on_algorithm_step, direct)
+        panel.algorithm_finished.connect(self._on_algorithm_finished, direct)
+        panel.reset_requested.connect(self.graph_canvas.clear_visualization_state, direct)
+        panel.run_requested.connect(self._flush_panel_graph, direct)
+        panel.set_graph(self.graph_canvas.graph)
     
     def _apply_styling(self):
         """Apply application styling"""
-        self.setStyleSheet("""
-            /* --- General Styles --- */
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                           stop:0 #1E1E2E, /* Dark base */
-                                           stop:1 #282838); /* Slightly lighter */
-                color: #E0E0E0; /* Light grey text */
-            }
-            
-            /* --- Menu Bar --- */
-            QMenuBar {
-                background-color: #282838; /* Match window gradient start */
-                color: #E0E0E0;
-                border-bottom: none; /* Remove border */
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                color: #E0E0E0;
-                padding: 4px 10px;
-            }
-            QMenuBar::item:selected {
-                background-color: rgba(80, 80, 100, 0.3); /* Subtle highlight */
-                border-radius: 4px;
-            }
-            
-            /* --- Menu --- */
-            QMenu {
-                background-color: #353545; /* Slightly darker than window */
-                color: #E0E0E0;
-                border: 1px solid #454555;
-                border-radius: 4px;
-            }
-             QMenu::separator {
-                height: 1px;
-                background-color: #454555;
-                margin-left: 10px;
-                margin-right: 10px;
-            }
-             QMenu::item {
-                padding: 5px 20px 5px 10px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(80, 80, 100, 0.5);
-                 border-radius: 4px;
-            }
-            
-            /* --- Tool Bar --- */
-            QToolBar {
-                background-color: #282838;
-                color: #E0E0E0;
-                border-bottom: none;
-                spacing: 10px; /* Space between tool buttons */
-            }
-
-            /* --- Group Box --- */
-            QGroupBox {
-                font-weight: bold;
-                color: #E0E0E0;
-                border: 1px solid #454555;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: rgba(40, 40, 50, 0.5); /* Semi-transparent background */
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #B0B0B0; /* Slightly lighter title color */
-            }
-            
-            /* --- Labels --- */
-            QLabel {
-                color: #E0E0E0;
-            }
-            
-            /* --- Buttons --- */
-            QPushButton {
-                background-color: #5A5A5A; /* Neutral grey button */
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 #6A1B9A, /* Purple start */
-                                           stop:1 #AB47BC); /* Lighter purple end */
-                 color: white;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QStatusBar {
-                background-color: #282838;
-                color: white;
-                border-top: 1px solid #3A3A3A;
-            }
-        """)
-    def _on_tool_changed(self, button):
-        """Handle tool button changes"""
-        tool_modes = ["add_vertex", "add_edge", "select", "delete"]
-        button_id = self.tool_buttons.id(button)
-        if 0 <= button_id < len(tool_modes):
-            self.graph_canvas.set_mode(tool_modes[button_id])
-            self.status_bar.showMessage(f"Mode: {tool_modes[button_id].replace('_', ' ').title()}")
+        # The stylesheet goes on the application, so it is parsed once and
+        # shared by every window instead of restyling each one separately
+        app = QApplication.instance()
+        if app.styleSheet() != _STYLESHEET:
+            app.setStyleSheet(_STYLESHEET)
+        
+        # Plain text colours come from palettes, which need no selector matching
+        for widget, color in (
+            (self, "#E0E0E0"),  # Light grey text
+            (self.status_bar, "white"),
+        ):
+            palette = widget.palette()
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+            widget.setPalette(palette)
+    
+    def _set_mode(self, mode: str, checked: bool = False):
+        """Switch the canvas to a tool mode"""
+        self.graph_canvas.set_mode(mode)
+        self.status_bar.showMessage(self._MODE_LABELS[mode])
     
+    @pyqtSlot()
     def _on_graph_changed(self):
         """Handle graph changes"""
-        vertices = len(self.graph_canvas.graph.get_vertices())
-        edges = len(self.graph_canvas.graph.get_edges())
-        self.graph_info_label.setText(f"Vertices: {vertices}, Edges: {edges}")
-        
-        # Update algorithm panel
-        self.algorithm_panel.set_graph(self.graph_canvas.graph)
+        graph = self.graph_canvas.graph
+        counts = (graph.vertex_count(), graph.edge_count())
+        if counts != self._last_counts:
+            self._last_counts = counts
+            self.graph_info_label.setText(f"Vertices: {counts[0]}, Edges: {counts[1]}")
+        
+        # Update algorithm panel once a burst of edits has settled
+        self._panel_graph_timer.start()
     
-    def _on_vertex_selected(self, vertex):
-        """Handle vertex selection"""
-        self.status_bar.showMessage(f"Selected vertex {vertex.id}")
+    @pyqtSlot()
+    def _update_panel_graph(self):
+        """Hand the edited graph to the algorithm panel"""
+        # Until the panel exists, _deferred_init hands it the graph
+        if self._algorithm_panel is not None:
+            self._algorithm_panel.set_graph(self.graph_canvas.graph)
     
-    def _on_edge_selected(self, edge):
-        """Handle edge selection"""
-        self.status_bar.showMessage(f"Selected edge ({edge.u.id}, {edge.v.id})")
+    @pyqtSlot()
+    def _flush_panel_graph(self):
+        """Hand over a graph update still waiting on the debounce timer"""
+        if self._panel_graph_timer.isActive():
+            self._panel_graph_timer.stop()
+            self._update_panel_graph()
+    
+    @pyqtSlot(object)
+    def _on_selection_changed(self, item):
+        """Handle vertex or edge selection"""
+        if isinstance(item, Vertex):
+            self.status_bar.showMessage(f"Selected vertex {item.id}")
+        else:
+            self.status_bar.showMessage(f"Selected edge ({item.u.id}, {item.v.id})")
     
+    @pyqtSlot(StepResult)
     def _on_algorithm_step(self, step_result: StepResult):
         """Handle algorithm step"""
         # Update visualization
-        self.graph_canvas.set_vertex_cover(step_result.vertex_cover_so_far)
-        
-        if step_result.selected_edge:
-            self.graph_canvas.set_highlighted_edges({step_result.selected_edge})
-        else:
-            self.graph_canvas.set_highlighted_edges(set())
-        
-        if step_result.removed_edges:
-            self.graph_canvas.set_removed_edges(step_result.removed_edges)
-        
-        if step_result.added_vertices:
-            self.graph_canvas.set_added_vertices(step_result.added_vertices)
+        self.graph_canvas.apply_step(step_result)
         
         self.status_bar.showMessage(step_result.message)
     
+    @pyqtSlot(VertexCoverResult)
     def _on_algorithm_finished(self, result: VertexCoverResult):
         """Handle algorithm completion"""
         self.graph_canvas.set_vertex_cover(result.vertex_cover)
-        self.graph_canvas.set_highlighted_edges(set())
-        self.graph_canvas.set_removed_edges(set())
-        self.graph_canvas.set_added_vertices(set())
+        self.graph_canvas.reset_highlights()
         
         time_taken_str = f" ({result.time_taken:.4f} seconds)" if result.time_taken is not None else ""
         self.status_bar.showMessage(f"Algorithm completed! Vertex cover size: {len(result.vertex_cover)}{time_taken_str}")
     
+    @pyqtSlot()
     def _new_graph(self):
         """Create a new graph"""
         self._clear_graph()
         self.status_bar.showMessage("New graph created")
     
+    @pyqtSlot()
     def _clear_graph(self):
         """Clear the current graph"""
         self.graph_canvas.clear_graph()
         self.status_bar.showMessage("Graph cleared")
     
+    @pyqtSlot()
     def _clear_visualization(self):
         """Clear visualization highlighting"""
-        self.graph_canvas.clear_visualization_state()
-        self.algorithm_panel._reset_algorithm()
+        if self._algorithm_panel is not None:
+            self._algorithm_panel.reset()  # The canvas clears itself on reset_requested
+        else:
+            self.graph_canvas.clear_visualization_state()
         self.status_bar.showMessage("Visualization cleared")
     
+    def _choose_file(self, title: str, name_filters: List[str], save: bool = False) -> str:
+        """Ask for a file name, returning an empty string if the user cancels"""
+        # One non-native dialog is built on first use and reused, so later
+        # dialogs open without reloading the platform file browser
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setNameFilters(name_filters)
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        else:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.selectFile("")
+        if dialog.exec() != QFileDialog.DialogCode.Accepted:
+            return ""
+        return dialog.selectedFiles()[0]
+    
+    def _start_file_task(self, function, args, on_finished, error_message: str):
+        """Run a file operation on the thread pool, handling its outcome on the GUI thread"""
+        task = _FileTask(function, *args)
+        self._file_tasks.add(task)
+        
+        def finished(result):
+            self._file_tasks.discard(task)
+            on_finished(result)
+        
+        def failed(message):
+            self._file_tasks.discard(task)
+            QMessageBox.critical(self, "Error", f"{error_message}: {message}")
+        
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(task)
+    
+    @pyqtSlot()
     def _open_graph(self):
         """Open a graph from file"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Open Graph", "", "JSON Files (*.json);;All Files (*)"
-        )
+        filename = self._choose_file("Open Graph", ["JSON Files (*.json)", "All Files (*)"])
         if filename:
+            # Read and parse off the GUI thread, then build the graph here
+            self._start_file_task(
+                _read_json, (filename,),
+                lambda data: self._apply_loaded_graph(filename, data),
+                "Failed to load graph"
+            )
+    
+    def _apply_loaded_graph(self, filename: str, data):
+        """Replace the current graph with one parsed from a file"""
+        try:
+            vertices_data = data.get('vertices', [])
+            edges_data = data.get('edges', [])
+            
+            # Check the edge endpoints before touching the current graph
+            known_ids = {v_data['id'] for v_data in vertices_data}
+            endpoint_ids = {e_data['u'] for e_data in edges_data} | {e_data['v'] for e_data in edges_data}
+            missing = endpoint_ids - known_ids
+            if missing:
+                raise ValueError(f"edges refer to unknown vertices {sorted(missing, key=str)}")
+            
+            # Rebuild the graph with canvas signals and repaints held back,
+            # then announce the change once
+            canvas = self.graph_canvas
+            canvas.blockSignals(True)
+            canvas.setUpdatesEnabled(False)
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                
                 # Clear current graph
-                self.graph_canvas.clear_graph()
-                
-                # Load vertices
-                vertex_map = {}
-                for v_data in data.get('vertices', []):
-                    vertex = self.graph_canvas.graph.add_vertex(v_data['x'], v_data['y'])
-                    vertex_map[v_data['id']] = vertex
-                
-                # Load edges
-                for e_data in data.get('edges', []):
-                    u = vertex_map.get(e_data['u'])
-                    v = vertex_map.get(e_data['v'])
-                    if u and v:
-                        self.graph_canvas.graph.add_edge(u, v)
+                canvas.clear_graph()
                 
-                self.graph_canvas.update()
-                self._on_graph_changed()
-                self.status_bar.showMessage(f"Graph loaded from {filename}")
+                # Load vertices in one batch
+                graph = canvas.graph
+                vertices = graph.add_vertices_bulk(
+                    (v_data['x'], v_data['y']) for v_data in vertices_data
+                )
+                vertex_map = {v_data['id']: vertex for v_data, vertex in zip(vertices_data, vertices)}
                 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load graph: {e}")
+                # Load edges in one batch; every endpoint is known by now
+                graph.add_edges_bulk(
+                    (vertex_map[e_data['u']], vertex_map[e_data['v']])
+                    for e_data in edges_data
+                )
+            finally:
+                canvas.blockSignals(False)
+                canvas.setUpdatesEnabled(True)  # Also schedules a repaint
+                canvas.graph_changed.emit()
+            
+            self.status_bar.showMessage(f"Graph loaded from {filename}")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load graph: {e}")
     
+    @pyqtSlot()
     def _save_graph(self):
         """Save the current graph to file"""
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Save Graph", "", "JSON Files (*.json);;All Files (*)"
-        )
+        filename = self._choose_file("Save Graph", ["JSON Files (*.json)", "All Files (*)"], save=True)
         if filename:
             try:
                 # Prepare data
-                vertices_data = []
-                for vertex in self.graph_canvas.graph.get_vertices():
-                    vertices_data.append({
-                        'id': vertex.id,
-                        'x': vertex.x,
-                        'y': vertex.y
-                    })
-                
-                edges_data = []
-                for edge in self.graph_canvas.graph.get_edges():
-                    edges_data.append({
-                        'u': edge.u.id,
-                        'v': edge.v.id
-                    })
-                
+                graph = self.graph_canvas.graph
                 data = {
-                    'vertices': vertices_data,
-                    'edges': edges_data
+                    'vertices': [
+                        {'id': vertex.id, 'x': vertex.x, 'y': vertex.y}
+                        for vertex in graph.get_vertices()
+                    ],
+                    'edges': [
+                        {'u': edge.u.id, 'v': edge.v.id}
+                        for edge in graph.get_edges()
+                    ]
                 }
                 
-                # Save to file
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
-                
-                self.status_bar.showMessage(f"Graph saved to {filename}")
+                # Encode and write off the GUI thread
+                self._start_file_task(
+                    _write_json, (filename, data),
+                    lambda result: self.status_bar.showMessage(f"Graph saved to {filename}"),
+                    "Failed to save graph"
+                )
                 
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save graph: {e}")
     
+    @pyqtSlot()
     def _export_image(self):
         """Export the graph canvas as an image"""
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Export Image", "", "PNG Files (*.png);;All Files (*)"
-        )
+        filename = self._choose_file("Export Image", ["PNG Files (*.png)", "All Files (*)"], save=True)
         if filename:
             try:
-                pixmap = self.graph_canvas.grab()
-                pixmap.save(filename)
-                self.status_bar.showMessage(f"Image exported to {filename}")
+                # Render straight into an image at the screen resolution
+                canvas = self.graph_canvas
+                ratio = canvas.devicePixelRatioF()
+                image = QImage(canvas.size() * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+                image.setDevicePixelRatio(ratio)
+                image.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(image)
+                canvas.render(painter)
+                painter.end()
+                
+                # Encode and write off the GUI thread
+                self._start_file_task(
+                    _write_image, (filename, image),
+                    lambda result: self.status_bar.showMessage(f"Image exported to {filename}"),
+                    "Failed to export image"
+                )
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export image: {e}")
     
+    @pyqtSlot()
     def _show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self,
-            "About Vertex Cover Visualization Tool",
-            """<h3>Vertex Cover Visualization Tool</h3>
-            <p>A tool for visualizing vertex cover algorithms step by step.</p>
-            <p><b>Features:</b></p>
-            <ul>
-            <li>Interactive graph creation and editing</li>
-            <li>Step-by-step algorithm visualization</li>
-            <li>Multiple vertex cover algorithms</li>
-            <li>Graph import/export functionality</li>
-            </ul>
-            <p><b>Version:</b> 1.0</p>
-            <p><b>Built with:</b> Python and PyQt6</p>
-            """
-        )
\ No newline at end of file
+        # Built on first use and kept, so the text is only laid out once
+        if self._about_dialog is None:
+            self._about_dialog = QMessageBox(self)
+            self._about_dialog.setWindowTitle("About Vertex Cover Visualization Tool")
+            self._about_dialog.setTextFormat(Qt.TextFormat.RichText)
+            self._about_dialog.setText(_ABOUT_HTML)
+        self._about_dialog.exec()
@@ -3,7 +3,7 @@
 Algorithm result data structures for vertex cover visualization
 """
 
-from typing import Set, Optional
+from typing import AbstractSet, Set, Optional
 from dataclasses import dataclass
 from .graph import Vertex, Edge
 
@@ -14,14 +14,9 @@ class StepResult:
     remaining_edges: Set[Edge]
     message: str
     selected_edge: Optional[Edge] = None
-    added_vertices: Optional[Set[Vertex]] = None
-    removed_edges: Optional[Set[Edge]] = None
-    
-    def __post_init__(self):
-        if self.added_vertices is None:
-            self.added_vertices = set()
-        if self.removed_edges is None:
-            self.removed_edges = set()
+    # Steps are read-only, so every step can share one empty default
+    added_vertices: AbstractSet[Vertex] = frozenset()
+    removed_edges: AbstractSet[Edge] = frozenset()
 
 @dataclass
 class VertexCoverResult:
@@ -3,18 +3,21 @@
 Graph data model for vertex cover visualization
 """
 
-from typing import Set, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Set, List, Tuple, Optional
+from dataclasses import dataclass, field
+import numpy as np
 
-@dataclass(frozen=True)
+@dataclass(eq=False)
 class Vertex:
     """Represents a vertex in the graph"""
+    # Hashing and equality use only the id, so x and y can be moved in
+    # place while the vertex sits in sets and edges
     id: int
     x: float = 0.0
     y: float = 0.0
     
     def __hash__(self):
-        return hash(self.id)
+        return self.id  # Small ints hash to themselves anyway
     
     def __eq__(self, other):
         if isinstance(other, Vertex):
@@ -23,23 +26,28 @@ class Vertex:
 
 @dataclass(frozen=True)
 class Edge:
-    """Represents an edge in the graph"""
+    """
+    Represents an edge in the graph
+    
+    Edges are undirected and kept in canonical order, with u.id < v.id.
+    The Graph creates every edge that way, and hashing and equality rely on it,
+    so an Edge built by hand with the endpoints swapped is not equal to the
+    graph's edge; Graph.has_edge and Graph.remove_edge accept either order.
+    """
     u: Vertex
     v: Vertex
+    # Edges live in many sets, so the hash is computed once
+    _hash: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        # Ensure consistent ordering for undirected edges
-        if self.u.id > self.v.id:
-            object.__setattr__(self, 'u', self.v)
-            object.__setattr__(self, 'v', self.u)
+        object.__setattr__(self, '_hash', (self.u.id * 1000003) ^ self.v.id)
     
     def __hash__(self):
-        return hash((self.u, self.v))
+        return self._hash
     
     def __eq__(self, other):
         if isinstance(other, Edge):
-            return (self.u == other.u and self.v == other.v) or \
-                   (self.u == other.v and self.v == other.u)
+            return self.u == other.u and self.v == other.v
         return False
     
     def contains_vertex(self, vertex: Vertex) -> bool:
@@ -57,18 +65,77 @@ class Edge:
 class Graph:
     """Graph data structure for vertex cover algorithms"""
     
+    # Side length of the square cells of the vertex position index
+    GRID_CELL_SIZE = 50.0
+    
     def __init__(self):
         self._vertices: Set[Vertex] = set()
         self._edges: Set[Edge] = set()
         self._next_vertex_id = 1
+        self._edges_soa: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Immutable snapshots handed out by get_vertices/get_edges, rebuilt
+        # only after the vertex or edge set changes
+        self._vertices_frozen: Optional[FrozenSet[Vertex]] = None
+        self._edges_frozen: Optional[FrozenSet[Edge]] = None
+        # Incident edges of every vertex id, keyed by the neighbour's id, so
+        # incidence queries cost O(degree) instead of a scan over all edges
+        self._incidence: Dict[int, Dict[int, Edge]] = {}
+        self._vertex_by_id: Dict[int, Vertex] = {}
+        # Uniform grid of vertex positions, for hit-testing
+        self._vertex_grid: Dict[Tuple[int, int], List[Vertex]] = {}
+        self._vertex_cells: Dict[int, Tuple[int, int]] = {}
+    
+    def _grid_cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Get the grid cell containing a position"""
+        return (int(x // self.GRID_CELL_SIZE), int(y // self.GRID_CELL_SIZE))
+    
+    def _grid_insert(self, vertex: Vertex):
+        """Add a vertex to the grid cell of its position"""
+        cell = self._grid_cell(vertex.x, vertex.y)
+        self._vertex_grid.setdefault(cell, []).append(vertex)
+        self._vertex_cells[vertex.id] = cell
+    
+    def _grid_remove(self, vertex: Vertex):
+        """Remove a vertex from the grid cell it was filed under"""
+        cell = self._vertex_cells.pop(vertex.id)
+        bucket = self._vertex_grid[cell]
+        bucket.remove(vertex)
+        if not bucket:
+            del self._vertex_grid[cell]
     
     def add_vertex(self, x: float = 0.0, y: float = 0.0) -> Vertex:
         """Add a new vertex to the graph"""
         vertex = Vertex(self._next_vertex_id, x, y)
         self._vertices.add(vertex)
+        self._vertices_frozen = None
+        self._incidence[vertex.id] = {}
+        self._vertex_by_id[vertex.id] = vertex
+        self._grid_insert(vertex)
         self._next_vertex_id += 1
         return vertex
     
+    def add_vertices_bulk(self, positions: Iterable[Tuple[float, float]]) -> List[Vertex]:
+        """Add one new vertex per (x, y) position, numbered in order"""
+        first_id = self._next_vertex_id
+        vertices = [Vertex(first_id + i, x, y) for i, (x, y) in enumerate(positions)]
+        self._vertices.update(vertices)
+        if vertices:
+            self._vertices_frozen = None
+        for vertex in vertices:
+            self._incidence[vertex.id] = {}
+            self._vertex_by_id[vertex.id] = vertex
+            self._grid_insert(vertex)
+        self._next_vertex_id = first_id + len(vertices)
+        return vertices
+    
+    def move_vertex(self, vertex: Vertex, x: float, y: float):
+        """Move a vertex of the graph to a new position"""
+        vertex.x = x
+        vertex.y = y
+        if self._grid_cell(x, y) != self._vertex_cells[vertex.id]:
+            self._grid_remove(vertex)
+            self._grid_insert(vertex)
+    
     def add_edge(self, u: Vertex, v: Vertex) -> bool:
         """Add an edge between two vertices"""
         if u not in self._vertices or v not in self._vertices:
@@ -80,11 +147,38 @@ class Graph:
         if u.id > v.id:
             u, v = v, u # Swap to ensure u.id <= v.id
             
+        if v.id in self._incidence[u.id]:
+            return False
         edge = Edge(u, v)
-        if edge not in self._edges:
-            self._edges.add(edge)
-            return True
-        return False
+        self._edges.add(edge)
+        self._incidence[u.id][v.id] = edge
+        self._incidence[v.id][u.id] = edge
+        self._edges_soa = None
+        self._edges_frozen = None
+        return True
+    
+    def add_edges_bulk(self, pairs: Iterable[Tuple[Vertex, Vertex]]) -> int:
+        """Add an edge for every vertex pair that add_edge would accept, returning how many were added"""
+        vertices = self._vertices
+        edges = self._edges
+        incidence = self._incidence
+        count = len(edges)
+        for u, v in pairs:
+            if u not in vertices or v not in vertices or u == v:
+                continue
+            if v.id in incidence[u.id]:
+                continue
+            if u.id > v.id:
+                u, v = v, u
+            edge = Edge(u, v)
+            edges.add(edge)
+            incidence[u.id][v.id] = edge
+            incidence[v.id][u.id] = edge
+        added = len(edges) - count
+        if added:
+            self._edges_soa = None
+            self._edges_frozen = None
+        return added
     
     def remove_vertex(self, vertex: Vertex) -> bool:
         """Remove a vertex and all its incident edges"""
@@ -92,61 +186,156 @@ class Graph:
             return False
         
         # Remove all incident edges
-        incident_edges = self.get_incident_edges(vertex)
-        for edge in incident_edges:
+        incident = self._incidence.pop(vertex.id)
+        for neighbor_id, edge in incident.items():
             self._edges.remove(edge)
+            del self._incidence[neighbor_id][vertex.id]
+        if incident:
+            self._edges_soa = None
+            self._edges_frozen = None
         
+        del self._vertex_by_id[vertex.id]
         self._vertices.remove(vertex)
+        self._vertices_frozen = None
+        self._grid_remove(vertex)
         return True
     
     def remove_edge(self, edge: Edge) -> bool:
-        """Remove an edge from the graph"""
-        if edge in self._edges:
-            self._edges.remove(edge)
-            return True
-        return False
+        """Remove an edge from the graph, with its endpoints in either order"""
+        # Look the edge up by endpoint ids, which does not depend on the order
+        neighbors = self._incidence.get(edge.u.id)
+        stored = neighbors.get(edge.v.id) if neighbors else None
+        if stored is None:
+            return False
+        self._edges.remove(stored)
+        del self._incidence[stored.u.id][stored.v.id]
+        del self._incidence[stored.v.id][stored.u.id]
+        self._edges_soa = None
+        self._edges_frozen = None
+        return True
+    
+    def has_edge(self, u: Vertex, v: Vertex) -> bool:
+        """Check whether two vertices are joined by an edge, in either order"""
+        neighbors = self._incidence.get(u.id)
+        return bool(neighbors) and v.id in neighbors
+    
+    def get_vertices(self) -> FrozenSet[Vertex]:
+        """
+        Get all vertices in the graph
+        
+        The result is an immutable snapshot that is shared between calls
+        until the vertex set changes; callers that need to modify it must
+        copy it with set().
+        """
+        if self._vertices_frozen is None:
+            self._vertices_frozen = frozenset(self._vertices)
+        return self._vertices_frozen
+    
+    def get_edges(self) -> FrozenSet[Edge]:
+        """
+        Get all edges in the graph
+        
+        Like get_vertices, this is a shared immutable snapshot of the edge set.
+        """
+        if self._edges_frozen is None:
+            self._edges_frozen = frozenset(self._edges)
+        return self._edges_frozen
+    
+    def vertex_count(self) -> int:
+        """Get the number of vertices without copying them"""
+        return len(self._vertices)
     
-    def get_vertices(self) -> Set[Vertex]:
-        """Get all vertices in the graph"""
-        return self._vertices.copy()
+    def edge_count(self) -> int:
+        """Get the number of edges without copying them"""
+        return len(self._edges)
     
-    def get_edges(self) -> Set[Edge]:
-        """Get all edges in the graph"""
-        return self._edges.copy()
+    def edges_soa(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the endpoint ids of all edges as two parallel arrays
+        
+        The arrays are sorted in canonical (u.id, v.id) order, built once
+        and reused until the edge set changes, so they must not be modified.
+        """
+        if self._edges_soa is None:
+            # Pack each edge into one int64 so a single sort orders them
+            packed = np.fromiter(
+                ((edge.u.id << 32) | edge.v.id for edge in self._edges),
+                dtype=np.int64, count=len(self._edges)
+            )
+            packed.sort()
+            eu, ev = packed >> 32, packed & 0xFFFFFFFF
+            eu.flags.writeable = False
+            ev.flags.writeable = False
+            self._edges_soa = (eu, ev)
+        return self._edges_soa
     
     def get_incident_edges(self, vertex: Vertex) -> Set[Edge]:
         """Get all edges incident to a vertex"""
-        return {edge for edge in self._edges if edge.contains_vertex(vertex)}
+        incident = self._incidence.get(vertex.id)
+        return set(incident.values()) if incident else set()
     
     def get_neighbors(self, vertex: Vertex) -> Set[Vertex]:
         """Get all neighbors of a vertex"""
-        neighbors = set()
-        for edge in self.get_incident_edges(vertex):
-            other = edge.get_other_vertex(vertex)
-            if other:
-                neighbors.add(other)
-        return neighbors
+        vertex_by_id = self._vertex_by_id
+        return {vertex_by_id[neighbor_id] for neighbor_id in self._incidence.get(vertex.id, ())}
     
     def get_vertex_by_id(self, vertex_id: int) -> Optional[Vertex]:
         """Get vertex by its ID"""
-        for vertex in self._vertices:
-            if vertex.id == vertex_id:
-                return vertex
-        return None
+        return self._vertex_by_id.get(vertex_id)
     
     def get_vertex_at_position(self, x: float, y: float, tolerance: float = 20.0) -> Optional[Vertex]:
-        """Get vertex at given position within tolerance"""
-        for vertex in self._vertices:
-            distance = ((vertex.x - x) ** 2 + (vertex.y - y) ** 2) ** 0.5
-            if distance <= tolerance:
-                return vertex
-        return None
+        """Get the vertex nearest to a position, within tolerance"""
+        min_x, min_y = self._grid_cell(x - tolerance, y - tolerance)
+        max_x, max_y = self._grid_cell(x + tolerance, y + tolerance)
+        nearest = None
+        nearest_distance = tolerance * tolerance
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                for vertex in self._vertex_grid.get((cell_x, cell_y), ()):
+                    distance = (vertex.x - x) ** 2 + (vertex.y - y) ** 2
+                    if distance <= nearest_distance:
+                        nearest = vertex
+                        nearest_distance = distance
+        return nearest
+    
+    def get_vertices_in_rect(self, left: float, top: float, right: float, bottom: float) -> List[Vertex]:
+        """Get the vertices whose positions lie inside a rectangle"""
+        min_x, min_y = self._grid_cell(left, top)
+        max_x, max_y = self._grid_cell(right, bottom)
+        grid = self._vertex_grid
+        if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(grid):
+            buckets = [
+                grid[cell]
+                for cell in (
+                    (cell_x, cell_y)
+                    for cell_x in range(min_x, max_x + 1)
+                    for cell_y in range(min_y, max_y + 1)
+                )
+                if cell in grid
+            ]
+        else:
+            # A large rectangle: visiting the occupied cells is cheaper
+            buckets = [
+                bucket for (cell_x, cell_y), bucket in grid.items()
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y
+            ]
+        return [
+            vertex for bucket in buckets for vertex in bucket
+            if left <= vertex.x <= right and top <= vertex.y <= bottom
+        ]
     
     def clear(self):
         """Clear all vertices and edges"""
         self._vertices.clear()
         self._edges.clear()
         self._next_vertex_id = 1
+        self._edges_soa = None
+        self._vertices_frozen = None
+        self._edges_frozen = None
+        self._incidence.clear()
+        self._vertex_by_id.clear()
+        self._vertex_grid.clear()
+        self._vertex_cells.clear()
     
     def copy(self) -> 'Graph':
         """Create a copy of the graph"""
@@ -157,13 +346,19 @@ class Graph:
         for vertex in self._vertices:
             new_vertex = Vertex(vertex.id, vertex.x, vertex.y)
             new_graph._vertices.add(new_vertex)
+            new_graph._incidence[new_vertex.id] = {}
+            new_graph._vertex_by_id[new_vertex.id] = new_vertex
+            new_graph._grid_insert(new_vertex)
             vertex_mapping[vertex] = new_vertex
         
         # Copy edges
         for edge in self._edges:
             new_u = vertex_mapping[edge.u]
             new_v = vertex_mapping[edge.v]
-            new_graph._edges.add(Edge(new_u, new_v))
+            new_edge = Edge(new_u, new_v)
+            new_graph._edges.add(new_edge)
+            new_graph._incidence[new_u.id][new_v.id] = new_edge
+            new_graph._incidence[new_v.id][new_u.id] = new_edge
         
         new_graph._next_vertex_id = self._next_vertex_id
         return new_graph
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests of the vertex cover algorithms against exhaustive search, and of the
+helpers they share
+"""
+
+import itertools
+import random
+
+import pytest
+
+from models import Graph
+from algorithms import run_algorithm, run_algorithm_fast
+from algorithms._bitset import order_vertices
+from algorithms._kernels import edge_arrays, greedy_cover_nb, two_approx_cover_nb
+from algorithms._reductions import reduce_vertices
+
+def _random_graph(rng: random.Random, n: int, p: float) -> Graph:
+    """Build a graph on n vertices where every pair is an edge with probability p"""
+    graph = Graph()
+    vertices = graph.add_vertices_bulk((rng.uniform(0, 500), rng.uniform(0, 500)) for _ in range(n))
+    graph.add_edges_bulk(pair for pair in itertools.combinations(vertices, 2) if rng.random() < p)
+    return graph
+
+def _graph_from_pairs(n: int, pairs) -> Graph:
+    """Build a graph on n vertices with edges between the given index pairs"""
+    graph = Graph()
+    vertices = graph.add_vertices_bulk((50.0 * i, 0.0) for i in range(n))
+    graph.add_edges_bulk((vertices[a], vertices[b]) for a, b in pairs)
+    return graph
+
+def _adjacency(n: int, pairs):
+    """Neighbourhood masks of n vertex indices joined by the given pairs"""
+    adjacency = [0] * n
+    for a, b in pairs:
+        adjacency[a] |= 1 << b
+        adjacency[b] |= 1 << a
+    return adjacency
+
+def _mask(indices) -> int:
+    """Bitmask with the given vertex indices set"""
+    return sum(1 << index for index in indices)
+
+def _optimum_size(graph: Graph) -> int:
+    """Size of a minimum vertex cover, by trying every subset in order of size"""
+    vertices = sorted(graph.get_vertices(), key=lambda v: v.id)
+    edges = graph.get_edges()
+    for size in range(len(vertices) + 1):
+        for subset in itertools.combinations(vertices, size):
+            chosen = set(subset)
+            if all(edge.u in chosen or edge.v in chosen for edge in edges):
+                return size
+    raise AssertionError("the full vertex set is always a cover")
+
+def _drain(generator):
+    """Run a step generator to the end and return its result"""
+    try:
+        while True:
+            next(generator)
+    except StopIteration as stop:
+        return stop.value
+
+def _ids(vertices):
+    """Ids of a collection of vertices, for comparing covers"""
+    return {vertex.id for vertex in vertices}
+
+def _assert_cover(graph: Graph, cover):
+    """Check that every edge of the graph has an endpoint in the cover"""
+    assert all(edge.u in cover or edge.v in cover for edge in graph.get_edges())
+
+def _brute_force_cases():
+    """Seeded random graphs plus the shapes that hit the special cases"""
+    rng = random.Random(10123004)
+    cases = [
+        pytest.param(_graph_from_pairs(6, []), id="edgeless"),
+        pytest.param(Graph(), id="empty"),
+        pytest.param(_graph_from_pairs(7, [(0, i) for i in range(1, 7)]), id="star"),
+        pytest.param(
+            _graph_from_pairs(10, [(0, 1), (1, 2), (2, 0), (3, 4), (5, 6), (6, 7), (7, 8), (8, 5)]),
+            id="disconnected"
+        ),
+        # Vertex 0 has the highest degree but is in no minimum cover: taking
+        # its five neighbours leaves the 4-cycle 6-7-8-9, whose matching
+        # bound is exact, so a bound that is one too high prunes the optimum
+        pytest.param(
+            _graph_from_pairs(10, [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5),
+                                   (1, 2), (1, 3), (2, 3), (4, 5),
+                                   (1, 6), (1, 7), (2, 6), (2, 7), (3, 6), (3, 7),
+                                   (4, 8), (4, 9), (5, 8), (5, 9),
+                                   (6, 7), (7, 8), (8, 9), (9, 6)]),
+            id="tight-bound"
+        ),
+    ]
+    for index in range(40):
+        n = rng.randint(1, 10)
+        p = rng.choice((0.15, 0.3, 0.45))
+        cases.append(pytest.param(_random_graph(rng, n, p), id=f"random{index}-n{n}-p{p}"))
+    # Dense graphs, where the matching lower bound actually prunes branches
+    for index in range(30):
+        n = rng.randint(6, 10)
+        p = rng.choice((0.5, 0.7, 0.9))
+        cases.append(pytest.param(_random_graph(rng, n, p), id=f"dense{index}-n{n}-p{p}"))
+    return cases
+
+@pytest.mark.parametrize("graph", _brute_force_cases())
+def test_brute_force_is_optimal(graph):
+    """Brute force finds a minimum cover, with and without steps"""
+    optimum = _optimum_size(graph)
+
+    fast = run_algorithm_fast("Brute Force", graph)
+    _assert_cover(graph, fast.vertex_cover)
+    assert len(fast.vertex_cover) == optimum
+
+    stepped = _drain(run_algorithm("Brute Force", graph))
+    _assert_cover(graph, stepped.vertex_cover)
+    assert len(stepped.vertex_cover) == optimum
+
+def _parity_graphs():
+    """Seeded random graphs of every density, plus an edgeless one"""
+    rng = random.Random(10123010)
+    graphs = [pytest.param(_graph_from_pairs(5, []), id="edgeless")]
+    for index in range(20):
+        n = rng.randint(1, 40)
+        p = rng.choice((0.05, 0.2, 0.5, 0.9))
+        graphs.append(pytest.param(_random_graph(rng, n, p), id=f"random{index}-n{n}-p{p}"))
+    return graphs
+
+@pytest.mark.parametrize("graph", _parity_graphs())
+@pytest.mark.parametrize("name", ["Greedy", "2-Approximation"])
+def test_fast_paths_match_steps(name, graph):
+    """run_fast, a silent run and a stepped run all pick the same cover"""
+    stepped = _drain(run_algorithm(name, graph))
+    _assert_cover(graph, stepped.vertex_cover)
+    silent = _drain(run_algorithm(name, graph, yield_steps=False))
+    fast = run_algorithm_fast(name, graph)
+    assert _ids(fast.vertex_cover) == _ids(silent.vertex_cover) == _ids(stepped.vertex_cover)
+
+@pytest.mark.parametrize("graph", _parity_graphs())
+@pytest.mark.parametrize("kernel", [greedy_cover_nb, two_approx_cover_nb])
+def test_compiled_kernels_match_python(kernel, graph):
+    """The numba kernels agree with the plain Python fallback"""
+    pytest.importorskip("numba")
+    vertices, _ = order_vertices(graph)
+    eu, ev = edge_arrays(graph, vertices)
+    compiled = kernel(eu, ev, len(vertices))
+    assert compiled.tolist() == kernel.py_func(eu, ev, len(vertices)).tolist()
+
+# A 4-cycle has no vertex the rules can settle
+_CYCLE = [(3, 4), (4, 5), (5, 6), (6, 3)]
+
+@pytest.mark.parametrize("n, pairs, alive, forced, remaining", [
+    # Each end of the path is a pendant vertex that forces its neighbour
+    pytest.param(4, [(0, 1), (1, 2), (2, 3)], range(4), {1, 3}, (), id="pendant-path"),
+    # The apex 0 is left out and its adjacent neighbours are taken
+    pytest.param(7, [(0, 1), (0, 2), (1, 2), (1, 3), (2, 5), *_CYCLE], range(7), {1, 2},
+                 range(3, 7), id="triangle-apex"),
+    pytest.param(7, _CYCLE, range(7), (), range(3, 7), id="isolated"),
+    # Vertices outside the alive mask do not count as neighbours
+    pytest.param(4, [(0, 1), (0, 2), (0, 3)], range(1, 4), (), (), id="dead-centre"),
+])
+def test_reduce_vertices(n, pairs, alive, forced, remaining):
+    """The reduction rules force and drop exactly the settled vertices"""
+    assert reduce_vertices(_adjacency(n, pairs), _mask(alive)) == (_mask(forced), _mask(remaining))
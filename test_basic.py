@@ -1,169 +1,156 @@
 #!/usr/bin/env python3
 """
-Basic test script to verify the vertex cover visualization tool
+Basic tests to verify the vertex cover visualization tool
+
+Run them with pytest, or as a script: python test_basic.py
 """
 
+import importlib
+import importlib.util
+import logging
 import sys
-import os
+
+import pytest
+
+from models import Graph
+from algorithms import get_available_algorithms, run_algorithm
+
+# Progress messages; pytest collects them and shows them for failed tests,
+# or live with --log-cli-level=INFO
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+# Modules the tool needs, with the names the tests rely on
+_REQUIRED = (
+    ("models", ("Graph", "Vertex", "Edge", "StepResult", "VertexCoverResult")),
+    ("algorithms", ("get_available_algorithms", "run_algorithm")),
+)
+# The same for the GUI, whose tests are skipped without PyQt6
+_GUI_REQUIRED = (
+    ("PyQt6.QtWidgets", ("QApplication",)),
+    ("gui", ("MainWindow",)),
+)
+
+# Algorithm registry, looked up once and shared by the tests
+_ALGOS = None
+
+def _algos():
+    """Get the available algorithms, fetching them on first use"""
+    global _ALGOS
+    if _ALGOS is None:
+        _ALGOS = get_available_algorithms()
+    return _ALGOS
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False  # A parent package is missing
+
+def _check_imports(required):
+    """Import each module and check that it provides the expected names"""
+    missing = [name for name, _ in required if not _module_available(name)]
+    assert not missing, f"Missing modules {missing}; install them with: pip install -r requirements.txt"
+
+    for name, attributes in required:
+        module = importlib.import_module(name)
+        absent = [attribute for attribute in attributes if not hasattr(module, attribute)]
+        assert not absent, f"{name} does not provide {absent}"
+        log.info("✓ %s imported successfully", name)
 
 def test_imports():
     """Test that all modules can be imported"""
-    print("Testing imports...")
-    
-    try:
-        from models import Graph, Vertex, Edge, StepResult, VertexCoverResult
-        print("✓ Models imported successfully")
-    except ImportError as e:
-        print(f"✗ Failed to import models: {e}")
-        return False
-    
-    try:
-        from algorithms import get_available_algorithms, run_algorithm
-        print("✓ Algorithms imported successfully")
-    except ImportError as e:
-        print(f"✗ Failed to import algorithms: {e}")
-        return False
-    
-    try:
-        from PyQt6.QtWidgets import QApplication
-        print("✓ PyQt6 imported successfully")
-    except ImportError as e:
-        print(f"✗ Failed to import PyQt6: {e}")
-        print("Please install PyQt6: pip install PyQt6")
-        return False
-    
-    return True
+    log.info("Testing imports...")
+    _check_imports(_REQUIRED)
+
+@pytest.mark.gui
+def test_gui_imports():
+    """Test that the GUI modules can be imported"""
+    pytest.importorskip("PyQt6")
+    log.info("Testing GUI imports...")
+    _check_imports(_GUI_REQUIRED)
 
 def test_graph_operations():
     """Test basic graph operations"""
-    print("\nTesting graph operations...")
-    
-    from models import Graph
-    
+    log.info("Testing graph operations...")
+
     # Create graph
     graph = Graph()
-    print("✓ Graph created")
-    
+    log.info("✓ Graph created")
+
     # Add vertices
     v1 = graph.add_vertex(10, 20)
     v2 = graph.add_vertex(30, 40)
     v3 = graph.add_vertex(50, 60)
-    print(f"✓ Added 3 vertices: {v1.id}, {v2.id}, {v3.id}")
-    
+    log.info("✓ Added 3 vertices: %s, %s, %s", v1.id, v2.id, v3.id)
+
     # Add edges
     success1 = graph.add_edge(v1, v2)
     success2 = graph.add_edge(v2, v3)
-    print(f"✓ Added edges: {success1}, {success2}")
-    
+    log.info("✓ Added edges: %s, %s", success1, success2)
+    assert success1 and success2
+
     # Check graph state
     vertices = graph.get_vertices()
     edges = graph.get_edges()
-    print(f"✓ Graph has {len(vertices)} vertices and {len(edges)} edges")
-    
-    return True
+    log.info("✓ Graph has %d vertices and %d edges", len(vertices), len(edges))
+    assert len(vertices) == 3
+    assert len(edges) == 2
 
 def test_algorithms():
     """Test algorithm loading and basic execution"""
-    print("\nTesting algorithms...")
-    
-    from models import Graph
-    from algorithms import get_available_algorithms, run_algorithm
-    
+    log.info("Testing algorithms...")
+
     # Get available algorithms
-    algorithms = get_available_algorithms()
-    print(f"✓ Available algorithms: {list(algorithms.keys())}")
-    
-    # Create a simple graph
+    algorithms = _algos()
+    log.info("✓ Available algorithms: %s", list(algorithms))
+
+    # Create a simple graph: a triangle, built in one batch each
     graph = Graph()
-    v1 = graph.add_vertex(0, 0)
-    v2 = graph.add_vertex(100, 0)
-    v3 = graph.add_vertex(50, 100)
-    graph.add_edge(v1, v2)
-    graph.add_edge(v2, v3)
-    graph.add_edge(v1, v3)
-    
+    vertices = graph.add_vertices_bulk([(0, 0), (100, 0), (50, 100)])
+    added = graph.add_edges_bulk((vertices[a], vertices[b]) for a, b in ((0, 1), (1, 2), (0, 2)))
+    assert added == 3
+
     # Test 2-approximation algorithm
-    if "2-Approximation" in algorithms:
-        print("Testing 2-Approximation algorithm...")
+    if algorithms.get("2-Approximation") is not None:
+        log.info("Testing 2-Approximation algorithm...")
+        algorithm_gen = run_algorithm("2-Approximation", graph)
+        # Count the steps without keeping them; the final result is the
+        # generator's return value
+        step_count = 0
         try:
-            algorithm_gen = run_algorithm("2-Approximation", graph)
-            steps = list(algorithm_gen)
-            result = steps[-1] if steps else None
-            print(f"✓ 2-Approximation completed with {len(steps)} steps")
-            if hasattr(result, 'vertex_cover'):
-                print(f"✓ Found vertex cover of size {len(result.vertex_cover)}")
-        except Exception as e:
-            print(f"✗ 2-Approximation failed: {e}")
-            return False
-    
-    return True
-
-def test_gui_creation():
+            while True:
+                next(algorithm_gen)
+                step_count += 1
+        except StopIteration as stop:
+            result = stop.value
+        log.info("✓ 2-Approximation completed with %d steps", step_count)
+        assert step_count > 0
+        log.info("✓ Found vertex cover of size %d", len(result.vertex_cover))
+        assert all(edge.u in result.vertex_cover or edge.v in result.vertex_cover
+                   for edge in graph.get_edges())
+
+@pytest.mark.gui
+def test_gui_creation(qapp):
     """Test GUI component creation (without showing)"""
-    print("\nTesting GUI components...")
-    
-    try:
-        from PyQt6.QtWidgets import QApplication
-        from gui import MainWindow
-        
-        # Create application (required for Qt widgets)
-        app = QApplication([])
-        
-        # Create main window (but don't show it)
-        window = MainWindow()
-        print("✓ Main window created successfully")
-        
-        # Test basic functionality
-        print(f"✓ Window title: {window.windowTitle()}")
-        print(f"✓ Graph canvas created: {window.graph_canvas is not None}")
-        print(f"✓ Algorithm panel created: {window.algorithm_panel is not None}")
-        
-        # Clean up
-        window.close()
-        app.quit()
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ GUI test failed: {e}")
-        return False
-
-def main():
-    """Run all tests"""
-    print("Vertex Cover Visualization Tool - Basic Tests")
-    print("=" * 50)
-    
-    tests = [
-        test_imports,
-        test_graph_operations,
-        test_algorithms,
-        test_gui_creation
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                print(f"✗ {test.__name__} failed")
-        except Exception as e:
-            print(f"✗ {test.__name__} failed with exception: {e}")
-    
-    print("\n" + "=" * 50)
-    print(f"Tests completed: {passed}/{total} passed")
-    
-    if passed == total:
-        print("🎉 All tests passed! The application should work correctly.")
-        print("\nTo run the application:")
-        print("python main.py")
-    else:
-        print("❌ Some tests failed. Please check the error messages above.")
-        return 1
-    
-    return 0
+    log.info("Testing GUI components...")
+
+    from gui import MainWindow
+
+    # Create main window (but don't show it)
+    window = MainWindow()
+    log.info("✓ Main window created successfully")
+
+    # Test basic functionality
+    log.info("✓ Window title: %s", window.windowTitle())
+    log.info("✓ Graph canvas created: %s", window.graph_canvas is not None)
+    log.info("✓ Algorithm panel created: %s", window.algorithm_panel is not None)
+    assert window.graph_canvas is not None
+    assert window.algorithm_panel is not None
+
+    # Clean up
+    window.close()
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests that the Graph indexes stay consistent with its vertex and edge sets
+"""
+
+import random
+
+import pytest
+
+from models import Edge, Graph
+
+def _position(rng: random.Random):
+    """Random position, negative coordinates included"""
+    return rng.uniform(-200, 600), rng.uniform(-200, 600)
+
+def _check_indexes(graph: Graph, rng: random.Random):
+    """Compare every index query with the answer from the plain sets"""
+    vertices = graph.get_vertices()
+    edges = graph.get_edges()
+    assert graph.vertex_count() == len(vertices)
+    assert graph.edge_count() == len(edges)
+
+    for vertex in vertices:
+        incident = {edge for edge in edges if edge.contains_vertex(vertex)}
+        assert graph.get_incident_edges(vertex) == incident
+        assert graph.get_neighbors(vertex) == {edge.get_other_vertex(vertex) for edge in incident}
+        assert graph.get_vertex_by_id(vertex.id) is vertex
+
+    # Small rectangles visit their cells, large ones the occupied cells
+    for size in (30, 120, 900):
+        left, top = _position(rng)
+        right, bottom = left + rng.uniform(0, size), top + rng.uniform(0, size)
+        found = graph.get_vertices_in_rect(left, top, right, bottom)
+        assert len(found) == len(set(found))
+        assert set(found) == {
+            vertex for vertex in vertices
+            if left <= vertex.x <= right and top <= vertex.y <= bottom
+        }
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_operations_keep_indexes(seed):
+    """Random edits, copies and clears leave no index out of step"""
+    rng = random.Random(seed)
+    graph = Graph()
+    for _ in range(300):
+        vertices = sorted(graph.get_vertices(), key=lambda v: v.id)
+        operation = rng.choice(("add", "add", "bulk", "edge", "edges", "edges",
+                                "remove", "unlink", "move", "move", "copy", "clear"))
+        if operation == "add":
+            graph.add_vertex(*_position(rng))
+        elif operation == "bulk":
+            graph.add_vertices_bulk(_position(rng) for _ in range(rng.randint(0, 8)))
+        elif operation == "edge" and len(vertices) >= 2:
+            graph.add_edge(*rng.sample(vertices, 2))
+        elif operation == "edges" and len(vertices) >= 2:
+            graph.add_edges_bulk(rng.sample(vertices, 2) for _ in range(rng.randint(0, 10)))
+        elif operation == "remove" and vertices:
+            assert graph.remove_vertex(rng.choice(vertices))
+        elif operation == "unlink" and graph.edge_count():
+            assert graph.remove_edge(rng.choice(sorted(graph.get_edges(), key=lambda e: (e.u.id, e.v.id))))
+        elif operation == "move" and vertices:
+            vertex = rng.choice(vertices)
+            # Short moves often stay in the same grid cell
+            if rng.random() < 0.5:
+                graph.move_vertex(vertex, vertex.x + rng.uniform(-5, 5), vertex.y + rng.uniform(-5, 5))
+            else:
+                graph.move_vertex(vertex, *_position(rng))
+        elif operation == "copy":
+            original = graph
+            graph = graph.copy()
+            assert {v.id for v in graph.get_vertices()} == {v.id for v in original.get_vertices()}
+            assert graph.get_edges() == original.get_edges()
+            # Editing the copy must leave the original as it was
+            if vertices:
+                graph.remove_vertex(graph.get_vertex_by_id(rng.choice(vertices).id))
+            _check_indexes(original, rng)
+        elif operation == "clear" and rng.random() < 0.3:
+            graph.clear()
+        _check_indexes(graph, rng)
+
+def test_edges_given_in_reverse_order():
+    """Lookups and removal find an edge whose endpoints are given swapped"""
+    graph = Graph()
+    a, b, c = graph.add_vertices_bulk([(0, 0), (100, 0), (200, 0)])
+    graph.add_edges_bulk([(a, b), (b, c)])
+    reverse = Edge(b, a)
+
+    assert graph.has_edge(b, a) and graph.has_edge(a, b)
+    assert not graph.has_edge(a, c)
+    assert graph.remove_edge(reverse)
+    assert not graph.has_edge(a, b)
+    assert graph.get_edges() == {Edge(b, c)}
+    assert graph.get_neighbors(a) == set()
+    assert not graph.remove_edge(reverse)
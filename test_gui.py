@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tests of the GUI components, run without showing any window
+"""
+
+import time
+
+import pytest
+
+from models import StepResult, VertexCoverResult
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+pytestmark = pytest.mark.gui
+
+@pytest.fixture
+def canvas(qapp):
+    """A graph canvas whose partial repaints are recorded"""
+    from gui.graph_canvas import GraphCanvas
+
+    canvas = GraphCanvas()
+    canvas.repainted = []
+    canvas.update = lambda *rect: canvas.repainted.append(rect[0] if rect else canvas.rect())
+    yield canvas
+    canvas.close()
+
+def test_step_repaints_moved_vertex(canvas):
+    """A step from a copy of the graph repaints a vertex where it is now"""
+    vertex = canvas.graph.add_vertex(100, 100)
+    copy = canvas.graph.copy()
+    canvas.graph.move_vertex(vertex, 600, 500)
+
+    canvas.apply_step(StepResult(
+        vertex_cover_so_far={copy.get_vertex_by_id(vertex.id)},
+        remaining_edges=set(),
+        message="step"
+    ))
+    dirty = canvas.repainted[-1]
+    assert dirty.contains(600, 500)
+    assert not dirty.contains(100, 100)
+
+def test_step_repaints_everything_for_unknown_vertex(canvas):
+    """A step vertex missing from the canvas graph falls back to a full repaint"""
+    copy = canvas.graph.copy()
+    stale = copy.add_vertex(100, 100)
+
+    canvas.apply_step(StepResult(vertex_cover_so_far={stale}, remaining_edges=set(), message="step"))
+    assert canvas.repainted[-1] == canvas.rect()
+
+def test_highlighted_vertex_is_drawn_on_top(canvas):
+    """A cover vertex stays above an overlapping default vertex with a higher id"""
+    covered = canvas.graph.add_vertex(100, 100)
+    canvas.graph.add_vertex(110, 100)
+    canvas.vertex_cover = frozenset({covered})
+
+    # Inside both circles, clear of the id labels
+    color = canvas.grab().toImage().pixelColor(105, 85)
+    assert color.getRgb()[:3] == canvas.vertex_cover_color.getRgb()[:3]
+
+def _steps(count: int):
+    """A generator of numbered steps, like the ones algorithms produce"""
+    for index in range(count):
+        yield StepResult(vertex_cover_so_far=set(), remaining_edges=set(), message=f"step {index}")
+    return VertexCoverResult(vertex_cover=set(), total_steps=count, algorithm_name="test")
+
+def _wait_until(qapp, condition, timeout: float = 2.0) -> bool:
+    """Process events until the condition holds or the timeout runs out"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        qapp.processEvents()
+        time.sleep(0.002)
+    return True
+
+class _WorkerRun:
+    """An AlgorithmWorker on its own thread that records when steps arrive"""
+
+    def __init__(self, count: int, interval_ms: int, paused: bool = False):
+        from PyQt6.QtCore import QThread
+        from gui.algorithm_panel import AlgorithmWorker
+
+        self.step_times = []
+        self.results = []
+        self.worker = AlgorithmWorker(_steps(count), interval_ms)
+        if paused:
+            self.worker.pause()
+        self.thread = QThread()
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.step_ready.connect(self._on_step)
+        self.worker.finished.connect(self.results.append)
+        self.thread.start()
+
+    def _on_step(self, step: StepResult):
+        self.step_times.append(time.monotonic())
+        self.worker.step_displayed()
+
+    def stop(self) -> bool:
+        """Stop the worker and tell whether its thread exited"""
+        self.worker.stop()
+        self.thread.quit()
+        return self.thread.wait(2000)
+
+@pytest.fixture
+def worker_run(qapp):
+    """Start worker runs and stop them all at the end of the test"""
+    runs = []
+    def start(count: int, interval_ms: int, paused: bool = False) -> _WorkerRun:
+        run = _WorkerRun(count, interval_ms, paused)
+        runs.append(run)
+        return run
+    yield start
+    for run in runs:
+        assert run.stop()
+
+# Timers may fire a little early or late; gaps are checked with this slack
+_INTERVAL = 0.15
+_SLACK = 0.03
+
+def test_worker_paces_steps(qapp, worker_run):
+    """Steps come one interval apart and the result follows the last one"""
+    started = time.monotonic()
+    run = worker_run(3, int(_INTERVAL * 1000))
+    assert _wait_until(qapp, lambda: run.results)
+    gaps = [b - a for a, b in zip([started, *run.step_times], run.step_times)]
+    assert len(gaps) == 3
+    assert all(gap >= _INTERVAL - _SLACK for gap in gaps)
+    assert run.results[0].total_steps == 3
+
+def test_worker_single_steps_while_paused(qapp, worker_run):
+    """Next Step releases one step at once, and Resume goes back to the interval"""
+    run = worker_run(5, int(_INTERVAL * 1000), paused=True)
+    assert not _wait_until(qapp, lambda: run.step_times, timeout=2 * _INTERVAL)
+
+    requested = time.monotonic()
+    run.worker.request_step()
+    assert _wait_until(qapp, lambda: run.step_times)
+    assert run.step_times[0] - requested < _INTERVAL / 2
+    assert not _wait_until(qapp, lambda: len(run.step_times) > 1, timeout=2 * _INTERVAL)
+
+    resumed = time.monotonic()
+    run.worker.resume()
+    assert _wait_until(qapp, lambda: len(run.step_times) > 1)
+    assert run.step_times[1] - resumed >= _INTERVAL - _SLACK
+
+def test_worker_keeps_pace_after_spurious_resume(qapp, worker_run):
+    """A Resume that wakes nothing does not let the next step skip its interval"""
+    run = worker_run(3, int(_INTERVAL * 1000))
+    assert _wait_until(qapp, lambda: run.step_times)
+    run.worker.resume()
+    assert _wait_until(qapp, lambda: len(run.step_times) > 1)
+    assert run.step_times[1] - run.step_times[0] >= _INTERVAL - _SLACK
+
+def test_worker_stops_while_paused(qapp, worker_run):
+    """Stopping a paused worker ends its thread without another step or a result"""
+    run = worker_run(3, 10, paused=True)
+    time.sleep(0.05)
+    assert run.stop()
+    qapp.processEvents()
+    assert run.step_times == []
+    assert run.results == []
+
+def test_panel_drops_steps_of_stopped_runs(qapp):
+    """Steps still queued from a stopped worker are not shown"""
+    from gui.algorithm_panel import AlgorithmPanel
+    from models import Graph
+
+    graph = Graph()
+    u, v = graph.add_vertex(0, 0), graph.add_vertex(100, 0)
+    graph.add_edge(u, v)
+    panel = AlgorithmPanel()
+    panel.set_graph(graph)
+    panel.speed_spinbox.setValue(panel.speed_spinbox.maximum())
+    panel._run_algorithm()
+    stale = panel._worker
+    panel._reset_algorithm()
+    panel._run_algorithm()
+
+    shown = []
+    panel.algorithm_step.connect(shown.append)
+    stale.step_ready.emit(StepResult(vertex_cover_so_far=set(), remaining_edges=set(), message="stale"))
+    assert shown == []
+    assert panel.current_step == 0
+    panel._reset_algorithm()
+    panel.close()
+
+def test_run_flushes_pending_graph_update(qapp):
+    """An edit made just before Run does not reset the run once its debounce ends"""
+    from gui import MainWindow
+
+    window = MainWindow()
+    panel = window.algorithm_panel
+    graph = window.graph_canvas.graph
+    graph.add_edge(graph.add_vertex(100, 100), graph.add_vertex(300, 100))
+    window.graph_canvas.graph_changed.emit()
+
+    panel.run_button.click()
+    _wait_until(qapp, lambda: False, timeout=0.2)  # Let the debounce interval pass
+    assert panel._worker is not None
+    panel._reset_algorithm()
+    window.close()